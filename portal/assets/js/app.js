@@ -114,6 +114,7 @@ createApp({
             queryLogs: [],
             logFilter: 'all',
             logOffset: 0,
+            logCursors: [],
             logLimit: 50
         };
     },
@@ -1250,11 +1251,15 @@ createApp({
                 this.loading = true;
                 const matchedType = this.logFilter === 'all' ? null : this.logFilter;
 
+                // Keyset pagination: continue after the last log of the previous page
+                const cursor = this.logCursors[this.logCursors.length - 1];
+
                 const response = await axios.get(`${this.config.adminUrl}/admin/query_logs`, {
                     params: {
                         limit: this.logLimit,
-                        offset: this.logOffset,
-                        matched_type: matchedType
+                        matched_type: matchedType,
+                        before: cursor ? cursor.created_at : undefined,
+                        before_id: cursor ? cursor.rowid : undefined
                     }
                 });
 
@@ -1267,12 +1272,21 @@ createApp({
             }
         },
 
+        reloadQueryLogs() {
+            this.logOffset = 0;
+            this.logCursors = [];
+            this.loadQueryLogs();
+        },
+
         loadNextLogs() {
+            const last = this.queryLogs[this.queryLogs.length - 1];
+            this.logCursors.push({ created_at: last.created_at, rowid: last.rowid });
             this.logOffset += this.logLimit;
             this.loadQueryLogs();
         },
 
         loadPreviousLogs() {
+            this.logCursors.pop();
             this.logOffset = Math.max(0, this.logOffset - this.logLimit);
             this.loadQueryLogs();
         },
@@ -2,42 +2,23 @@
 Simple HTTP server for SpeakSense Admin Portal
 Serves the admin portal with CORS support
 """
-import http.server
-import socketserver
+import sys
 from pathlib import Path
 
-PORT = 8090
-DIRECTORY = Path(__file__).parent
-
-
-class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-    """HTTP request handler with CORS support"""
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, directory=str(DIRECTORY.parent), **kwargs)
-
-    def end_headers(self):
-        # Add CORS headers
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        super().end_headers()
-
-    def do_OPTIONS(self):
-        self.send_response(200)
-        self.end_headers()
+from shared.static_server import serve
 
+PORT = 8090
 
-if __name__ == "__main__":
-    with socketserver.TCPServer(("", PORT), CORSHTTPRequestHandler) as httpd:
-        print(f"""
+BANNER = """
 ╔═══════════════════════════════════════════════════════════╗
 ║                                                           ║
 ║          SpeakSense Admin Portal                         ║
 ║                                                           ║
 ╚═══════════════════════════════════════════════════════════╝
 
-🌐 Admin Portal: http://localhost:{PORT}/portal/index.html
+🌐 Admin Portal: http://localhost:{port}/portal/index.html
 
 📋 Features:
    - FAQ Management (Add, Edit, Delete)
@@ -46,9 +27,11 @@ if __name__ == "__main__":
 
 🔗 Testing Portal: http://localhost:8080/web/index.html
 
+⚙️  Worker processes: {workers}
+
 Press Ctrl+C to stop the server
-""")
-        try:
-            httpd.serve_forever()
-        except KeyboardInterrupt:
-            print("\n\nShutting down admin portal server...")
+"""
+
+
+if __name__ == "__main__":
+    serve(PORT, BANNER, "Shutting down admin portal server...")
@@ -101,6 +101,34 @@ class FAQManager:
 
         return self._to_faq_response(faq_entry)
 
+    def bulk_create_faqs(self, faqs: List[FAQCreate]) -> List[FAQResponse]:
+        """
+        Create many FAQ entries in one database transaction
+
+        Audio is left pending (as with create_faq's async default) and vector
+        indexing is done separately via the rebuild_indices endpoint.
+
+        Args:
+            faqs: List of FAQ creation data
+
+        Returns:
+            List of FAQResponse in input order
+        """
+        faq_entries = db.bulk_create_faqs([
+            {
+                'question': faq.question,
+                'answer': faq.answer,
+                'alternative_questions': faq.alternative_questions or [],
+                'language': faq.language,
+                'category': faq.category,
+                'audio_path': "",
+                'audio_status': "pending"
+            }
+            for faq in faqs
+        ])
+
+        return [self._to_faq_response(faq_entry) for faq_entry in faq_entries]
+
     async def generate_audio_for_faq(
         self,
         answer_id: str,
@@ -149,11 +177,23 @@ class FAQManager:
             return self._to_faq_response(faq_entry)
         return None
 
+    def get_faq_json(self, answer_id: str) -> Optional[bytes]:
+        """Get FAQ by ID as pre-serialized JSON bytes"""
+        faq_entry = db.get_faq_by_id(answer_id)
+
+        if faq_entry:
+            return faq_entry.as_json_bytes()
+        return None
+
     def list_faqs(self) -> List[FAQResponse]:
         """List all FAQs"""
         faq_entries = db.get_all_faqs()
         return [self._to_faq_response(entry) for entry in faq_entries]
 
+    def list_faqs_json(self) -> bytes:
+        """List all FAQs as a JSON array, joined from each entry's cached bytes"""
+        return b'[' + b','.join(entry.as_json_bytes() for entry in db.get_cached_faqs()) + b']'
+
     async def update_faq(
         self,
         answer_id: str,
@@ -262,18 +302,7 @@ class FAQManager:
 
     def _to_faq_response(self, faq_entry: FAQEntry) -> FAQResponse:
         """Convert FAQEntry to FAQResponse"""
-        return FAQResponse(
-            answer_id=faq_entry.answer_id,
-            question=faq_entry.question,
-            answer=faq_entry.answer,
-            alternative_questions=faq_entry.alternative_questions,
-            language=faq_entry.language,
-            category=faq_entry.category,
-            audio_path=faq_entry.audio_path,
-            audio_status=faq_entry.audio_status,
-            created_at=faq_entry.created_at,
-            updated_at=faq_entry.updated_at
-        )
+        return FAQResponse.from_db(faq_entry.to_dict())
 
 
 # Global FAQ manager instance
@@ -115,18 +115,7 @@ class IntentManager:
 
     def _to_intent_response(self, intent_entry: IntentEntry) -> IntentResponse:
         """Convert IntentEntry to IntentResponse"""
-        return IntentResponse(
-            intent_id=intent_entry.intent_id,
-            intent_name=intent_entry.intent_name,
-            description=intent_entry.description,
-            trigger_phrases=intent_entry.trigger_phrases,
-            action_type=intent_entry.action_type,
-            action_config=intent_entry.action_config,
-            language=intent_entry.language,
-            category=intent_entry.category,
-            created_at=intent_entry.created_at,
-            updated_at=intent_entry.updated_at
-        )
+        return IntentResponse.from_db(intent_entry.to_dict())
 
 
 # Global intent manager instance
@@ -2,9 +2,10 @@
 Admin Service - FAQ Management
 Provides API for creating, updating, and deleting FAQ entries with TTS generation
 """
-from fastapi import FastAPI, HTTPException, File, UploadFile, Form, BackgroundTasks
+from fastapi import FastAPI, HTTPException, File, UploadFile, Form, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional, List
+import asyncio
 import sys
 from pathlib import Path
 import json
@@ -161,19 +162,19 @@ async def create_faq_with_audio(
 @app.get("/admin/faq/{answer_id}", response_model=FAQResponse)
 async def get_faq(answer_id: str):
     """Get FAQ by ID"""
-    result = faq_manager.get_faq(answer_id)
+    result = faq_manager.get_faq_json(answer_id)
 
     if not result:
         raise HTTPException(status_code=404, detail=f"FAQ not found: {answer_id}")
 
-    return result
+    return Response(content=result, media_type="application/json")
 
 
 @app.get("/admin/faqs", response_model=List[FAQResponse])
 async def list_faqs():
     """List all FAQ entries"""
     try:
-        return faq_manager.list_faqs()
+        return Response(content=faq_manager.list_faqs_json(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list FAQs: {str(e)}")
 
@@ -192,7 +193,7 @@ async def update_faq(answer_id: str, updates: FAQUpdate):
     """
     try:
         # Convert Pydantic model to dict, excluding None values
-        update_dict = updates.dict(exclude_none=True)
+        update_dict = updates.to_updates()
 
         if not update_dict:
             raise HTTPException(status_code=400, detail="No updates provided")
@@ -254,22 +255,27 @@ async def batch_upload_faqs(faqs: List[FAQCreate]):
         created_faqs = []
         errors = []
 
-        for idx, faq in enumerate(faqs):
-            try:
-                result = await faq_manager.create_faq(
-                    question=faq.question,
-                    answer=faq.answer,
-                    alternative_questions=faq.alternative_questions or [],
-                    language=faq.language,
-                    category=faq.category
-                )
-                created_faqs.append(result)
-            except Exception as e:
-                errors.append({
-                    "index": idx,
-                    "question": faq.question,
-                    "error": str(e)
-                })
+        try:
+            # One transaction for the whole upload
+            created_faqs = faq_manager.bulk_create_faqs(faqs)
+        except Exception:
+            # Nothing was inserted; create one by one to report which entries fail
+            for idx, faq in enumerate(faqs):
+                try:
+                    result = await faq_manager.create_faq(
+                        question=faq.question,
+                        answer=faq.answer,
+                        alternative_questions=faq.alternative_questions or [],
+                        language=faq.language,
+                        category=faq.category
+                    )
+                    created_faqs.append(result)
+                except Exception as e:
+                    errors.append({
+                        "index": idx,
+                        "question": faq.question,
+                        "error": str(e)
+                    })
 
         return {
             "status": "completed",
@@ -381,7 +387,8 @@ async def get_dashboard_stats():
         from shared.models import DashboardStats
 
         # Get query statistics from database
-        stats = db.get_query_stats(days=7)
+        # Reading stats flushes queued query logs first; keep that off the event loop
+        stats = await asyncio.to_thread(db.get_query_stats, days=7)
 
         return DashboardStats(
             today_queries=stats['today_queries'],
@@ -399,13 +406,24 @@ async def get_dashboard_stats():
 async def get_query_logs(
     limit: int = 100,
     offset: int = 0,
-    matched_type: Optional[str] = None
+    matched_type: Optional[str] = None,
+    before: Optional[str] = None,
+    before_id: Optional[int] = None
 ):
-    """Get query logs with optional filtering and pagination"""
+    """
+    Get query logs with optional filtering and pagination
+
+    For the next page pass the created_at and rowid of the previous page's
+    last log as `before` and `before_id` (keyset pagination); `offset` is
+    still accepted for direct page access.
+    """
     try:
         from shared.database import db
 
-        logs = db.get_query_logs(limit=limit, offset=offset, matched_type=matched_type)
+        cursor = (before, before_id) if before and before_id is not None else None
+        logs = await asyncio.to_thread(
+            db.get_query_logs, limit=limit, offset=offset, matched_type=matched_type, before=cursor
+        )
         return logs
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get query logs: {str(e)}")
@@ -479,7 +497,7 @@ async def update_intent(intent_id: str, updates: IntentUpdate):
     """
     try:
         # Convert Pydantic model to dict, excluding None values
-        update_dict = updates.dict(exclude_none=True)
+        update_dict = updates.to_updates()
 
         if not update_dict:
             raise HTTPException(status_code=400, detail="No updates provided")
@@ -3,7 +3,7 @@ ASR Service - Automatic Speech Recognition
 Provides API for converting audio to text using Whisper
 Supports both file upload and WebSocket streaming with VAD
 """
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional
 import sys
@@ -110,6 +110,45 @@ async def transcribe_audio(
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
 
+@app.post("/asr/transcribe/raw", response_model=ASRResponse)
+async def transcribe_raw_audio(
+    request: Request,
+    language: Optional[str] = "auto",
+    audio_format: Optional[str] = "wav"
+):
+    """
+    Transcribe a raw audio request body (application/octet-stream)
+    Skips multipart parsing and the spooled upload file used by /asr/transcribe
+
+    Args:
+        request: Request whose body is the audio file
+        language: Language code (zh, en, auto)
+        audio_format: Audio file extension (wav, mp3, etc.)
+
+    Returns:
+        Transcription result with text and detected language
+    """
+    audio_bytes = await request.body()
+    if not audio_bytes:
+        raise HTTPException(status_code=400, detail="Empty audio body")
+
+    try:
+        result = asr_model.transcribe_from_bytes(
+            audio_bytes=audio_bytes,
+            language=language if language != "auto" else None,
+            audio_format=audio_format
+        )
+
+        return ASRResponse(
+            text=result['text'],
+            language=result.get('language'),
+            confidence=None
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+
+
 @app.post("/asr/switch_model")
 async def switch_model(
     model_name: str,
@@ -0,0 +1,228 @@
+"""
+FAISS Vector Store for SpeakSense
+HNSW + int8 scalar-quantized index exposing the subset of the ChromaDB
+client/collection API used by VectorSearch
+"""
+from typing import List, Dict, Optional
+from pathlib import Path
+import json
+import shutil
+import numpy as np
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+
+def _matches(metadata: Dict, where: Optional[Dict]) -> bool:
+    """Evaluate a ChromaDB-style where filter ({key: value} or {key: {'$in': [...]}})"""
+    if not where:
+        return True
+
+    for key, condition in where.items():
+        value = metadata.get(key)
+        if isinstance(condition, dict):
+            if '$in' in condition and value not in condition['$in']:
+                return False
+            if '$eq' in condition and value != condition['$eq']:
+                return False
+        elif value != condition:
+            return False
+
+    return True
+
+
+class FaissCollection:
+    """
+    Persistent FAISS IndexHNSWSQ collection with in-memory metadata
+
+    add/delete only change memory; call persist() once a batch of changes is done.
+    """
+
+    def __init__(self, path: Path, space: str = "cosine", m: int = 32, ef_search: int = 64,
+                 compact_ratio: float = 0.2):
+        self.path = Path(path)
+        self.space = space
+        self.m = m
+        self.ef_search = ef_search
+        self.compact_ratio = compact_ratio
+
+        self.index = None
+        self.ids: List[str] = []
+        self.documents: List[str] = []
+        self.metadatas: List[Dict] = []
+        self.deleted = set()  # HNSW can't remove vectors; deleted rows are skipped until _compact()
+
+        self._load()
+
+    @property
+    def _index_file(self) -> Path:
+        return self.path / "faiss.bin"
+
+    @property
+    def _meta_file(self) -> Path:
+        return self.path / "metadatas.json"
+
+    def _load(self):
+        """Load the index and metadata from disk if present"""
+        if self._index_file.exists():
+            self.index = faiss.read_index(str(self._index_file))
+            self.index.hnsw.efSearch = self.ef_search
+
+        if self._meta_file.exists():
+            with open(self._meta_file, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            self.space = meta.get('space', self.space)
+            self.ids = meta['ids']
+            self.documents = meta['documents']
+            self.metadatas = meta['metadatas']
+            self.deleted = set(meta.get('deleted', []))
+
+    def persist(self):
+        """Write the index and metadata to disk"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        if self.index is not None:
+            faiss.write_index(self.index, str(self._index_file))
+
+        with open(self._meta_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'space': self.space,
+                'ids': self.ids,
+                'documents': self.documents,
+                'metadatas': self.metadatas,
+                'deleted': sorted(self.deleted)
+            }, f, ensure_ascii=False)
+
+    def _create_index(self, embeddings: np.ndarray):
+        """Create the quantized HNSW index, trained on a fixed value range"""
+        metric = faiss.METRIC_L2 if self.space == "l2" else faiss.METRIC_INNER_PRODUCT
+        dim = embeddings.shape[1]
+        self.index = faiss.IndexHNSWSQ(dim, faiss.ScalarQuantizer.QT_8bit, self.m, metric)
+
+        # The quantizer is never retrained, so train it on [-bound, bound] per
+        # dimension rather than on the first batch: a single FAQ (add_faq) would
+        # give every dimension a zero-width range and collapse all later codes.
+        # Normalized embeddings lie in [-1, 1].
+        bound = max(1.0, float(np.abs(embeddings).max()))
+        self.index.train(np.array([[-bound] * dim, [bound] * dim], dtype=np.float32))
+        self.index.hnsw.efSearch = self.ef_search
+
+    def _to_distance(self, score: float) -> float:
+        """Convert a FAISS score to ChromaDB's distance convention"""
+        return float(score) if self.space == "l2" else 1.0 - float(score)
+
+    def add(self, ids: List[str], embeddings, documents: List[str], metadatas: List[Dict]):
+        """Add vectors with their documents and metadata"""
+        vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if self.index is None:
+            self._create_index(vectors)
+
+        self.index.add(vectors)
+        self.ids.extend(ids)
+        self.documents.extend(documents)
+        self.metadatas.extend(metadatas)
+
+    def query(self, query_embeddings, n_results: int = 10) -> Dict:
+        """Nearest-neighbour search returning ChromaDB-shaped results"""
+        result = {'ids': [], 'documents': [], 'metadatas': [], 'distances': []}
+        if self.index is None or self.index.ntotal == 0:
+            for key in result:
+                result[key] = [[] for _ in query_embeddings]
+            return result
+
+        queries = np.ascontiguousarray(query_embeddings, dtype=np.float32)
+        k = min(n_results + len(self.deleted), self.index.ntotal)
+        scores, indices = self.index.search(queries, k)
+
+        for row_scores, row_indices in zip(scores, indices):
+            ids, documents, metadatas, distances = [], [], [], []
+            for score, idx in zip(row_scores, row_indices):
+                if idx < 0 or idx in self.deleted:
+                    continue
+                ids.append(self.ids[idx])
+                documents.append(self.documents[idx])
+                metadatas.append(self.metadatas[idx])
+                distances.append(self._to_distance(score))
+                if len(ids) >= n_results:
+                    break
+
+            result['ids'].append(ids)
+            result['documents'].append(documents)
+            result['metadatas'].append(metadatas)
+            result['distances'].append(distances)
+
+        return result
+
+    def get(self, where: Optional[Dict] = None, include: Optional[List[str]] = None) -> Dict:
+        """Return live ids (and metadata/documents) matching a where filter"""
+        ids, documents, metadatas = [], [], []
+        for idx, metadata in enumerate(self.metadatas):
+            if idx in self.deleted or not _matches(metadata, where):
+                continue
+            ids.append(self.ids[idx])
+            documents.append(self.documents[idx])
+            metadatas.append(metadata)
+
+        return {'ids': ids, 'documents': documents, 'metadatas': metadatas}
+
+    def delete(self, ids: List[str]):
+        """Tombstone vectors by id"""
+        targets = set(ids)
+        for idx, doc_id in enumerate(self.ids):
+            if doc_id in targets:
+                self.deleted.add(idx)
+
+        # Tombstones widen every search (k grows with them); once they make up
+        # compact_ratio of the index, rebuild it from the live vectors
+        if self.deleted and len(self.deleted) >= self.compact_ratio * len(self.ids):
+            self._compact()
+
+    def _compact(self):
+        """Rebuild the index without tombstoned vectors"""
+        live = [idx for idx in range(len(self.ids)) if idx not in self.deleted]
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)[live] if live else None
+
+        self.ids = [self.ids[idx] for idx in live]
+        self.documents = [self.documents[idx] for idx in live]
+        self.metadatas = [self.metadatas[idx] for idx in live]
+        self.deleted = set()
+
+        self.index = None
+        if live:
+            self._create_index(vectors)
+            self.index.add(np.ascontiguousarray(vectors))
+
+    def count(self) -> int:
+        """Number of live vectors"""
+        return len(self.ids) - len(self.deleted)
+
+
+class FaissClient:
+    """Minimal stand-in for chromadb.PersistentClient backed by FAISS"""
+
+    def __init__(self, path: str, m: int = 32, ef_search: int = 64, compact_ratio: float = 0.2):
+        if not FAISS_AVAILABLE:
+            raise ImportError("faiss is not installed. Run: pip install faiss-cpu")
+        self.path = Path(path)
+        self.m = m
+        self.ef_search = ef_search
+        self.compact_ratio = compact_ratio
+
+    def get_collection(self, name: str) -> FaissCollection:
+        collection_path = self.path / name
+        if not (collection_path / "metadatas.json").exists():
+            raise ValueError(f"Collection {name} does not exist.")
+        return FaissCollection(collection_path, m=self.m, ef_search=self.ef_search,
+                               compact_ratio=self.compact_ratio)
+
+    def create_collection(self, name: str, metadata: Dict = None) -> FaissCollection:
+        space = (metadata or {}).get("hnsw:space", "cosine")
+        collection = FaissCollection(self.path / name, space=space, m=self.m, ef_search=self.ef_search,
+                               compact_ratio=self.compact_ratio)
+        collection.persist()
+        return collection
+
+    def delete_collection(self, name: str):
+        shutil.rmtree(self.path / name, ignore_errors=True)
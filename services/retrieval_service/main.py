@@ -2,9 +2,12 @@
 Retrieval Service - FAQ Search and Matching
 Provides API for hybrid FAQ retrieval using BM25 + Vector search
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Depends
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional, List
+import asyncio
 import sys
 from pathlib import Path
 
@@ -13,6 +16,7 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from shared.config_loader import config
 from shared.models import RetrievalRequest, RetrievalResponse, HealthResponse
+from shared.models_fast import decode_request
 from services.retrieval_service.retrieval import retrieval
 from services.retrieval_service.bm25_search import bm25_search
 from services.retrieval_service.vector_search import vector_search
@@ -40,8 +44,14 @@ async def startup_event():
     """Initialize search indices on startup"""
     print("Initializing retrieval service...")
     try:
-        bm25_search.initialize()
-        print(f"Vector database has {vector_search.count_documents()} documents")
+        # Build the BM25 index and load the embedding model / vector index in parallel.
+        # Attribute access on the lazy singletons constructs them, so defer it
+        # into the worker threads rather than touching them on the event loop.
+        _, document_count = await asyncio.gather(
+            asyncio.to_thread(lambda: bm25_search.initialize()),
+            asyncio.to_thread(lambda: vector_search.count_documents())
+        )
+        print(f"Vector database has {document_count} documents")
         print("Retrieval service initialized successfully!")
     except Exception as e:
         print(f"Warning: Failed to initialize some components: {e}")
@@ -67,8 +77,28 @@ async def health_check():
     )
 
 
-@app.post("/retrieval/search", response_model=List[RetrievalResponse])
-async def search_faq(request: RetrievalRequest):
+# The body is decoded by retrieval_request rather than by FastAPI, so document it explicitly
+RETRIEVAL_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": RetrievalRequest.model_json_schema()}}
+    }
+}
+
+
+async def retrieval_request(request: Request):
+    """Decode a RetrievalRequest body (via msgspec when installed)"""
+    try:
+        return decode_request(await request.body(), RetrievalRequest)
+    except ValidationError as e:
+        # Same 422 error list FastAPI produces for a declared body
+        raise RequestValidationError(
+            [{**error, 'loc': ('body', *error['loc'])} for error in e.errors()]
+        )
+
+
+@app.post("/retrieval/search", response_model=List[RetrievalResponse], openapi_extra=RETRIEVAL_REQUEST_BODY)
+async def search_faq(request: RetrievalRequest = Depends(retrieval_request)):
     """
     Search for matching FAQ
 
@@ -120,14 +150,14 @@ async def search_faq(request: RetrievalRequest):
             return []
 
         return [
-            RetrievalResponse(
-                answer_id=r['answer_id'],
-                question=r['question'],
-                answer=r['answer'],
-                audio_path=r['audio_path'],
-                confidence=r.get('confidence', r.get('score', 0.0)),
-                matched_by=r.get('matched_by', 'hybrid')
-            )
+            RetrievalResponse.from_db({
+                'answer_id': r['answer_id'],
+                'question': r['question'],
+                'answer': r['answer'],
+                'audio_path': r['audio_path'],
+                'confidence': float(r.get('confidence', r.get('score', 0.0))),
+                'matched_by': r.get('matched_by', 'hybrid')
+            })
             for r in results
         ]
 
@@ -135,8 +165,8 @@ async def search_faq(request: RetrievalRequest):
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
-@app.post("/retrieval/best_answer")
-async def get_best_answer(request: RetrievalRequest):
+@app.post("/retrieval/best_answer", openapi_extra=RETRIEVAL_REQUEST_BODY)
+async def get_best_answer(request: RetrievalRequest = Depends(retrieval_request)):
     """
     Get the best matching answer for a query
     Returns either an Intent or FAQ result based on what matches
@@ -196,13 +226,16 @@ async def get_best_answer(request: RetrievalRequest):
 
 
 @app.post("/retrieval/rebuild_indices")
-async def rebuild_indices():
+async def rebuild_indices(full: bool = False):
     """
     Rebuild BM25 and vector search indices
     Call this after adding/updating FAQs
+
+    Args:
+        full: Re-encode every document instead of only changed ones
     """
     try:
-        retrieval.rebuild_indices()
+        retrieval.rebuild_indices(full=full)
         return {
             "status": "success",
             "message": "Search indices rebuilt successfully",
@@ -224,8 +257,8 @@ async def get_stats():
     }
 
 
-@app.post("/retrieval/search_bm25")
-async def search_bm25_only(request: RetrievalRequest):
+@app.post("/retrieval/search_bm25", openapi_extra=RETRIEVAL_REQUEST_BODY)
+async def search_bm25_only(request: RetrievalRequest = Depends(retrieval_request)):
     """Search using BM25 only (for testing/debugging)"""
     try:
         results = retrieval.search(
@@ -239,8 +272,8 @@ async def search_bm25_only(request: RetrievalRequest):
         raise HTTPException(status_code=500, detail=f"BM25 search failed: {str(e)}")
 
 
-@app.post("/retrieval/search_vector")
-async def search_vector_only(request: RetrievalRequest):
+@app.post("/retrieval/search_vector", openapi_extra=RETRIEVAL_REQUEST_BODY)
+async def search_vector_only(request: RetrievalRequest = Depends(retrieval_request)):
     """Search using vector search only (for testing/debugging)"""
     try:
         results = retrieval.search(
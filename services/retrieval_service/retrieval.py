@@ -209,11 +209,11 @@ class HybridRetrieval:
         else:
             return None
 
-    def rebuild_indices(self):
-        """Rebuild both BM25 and vector search indices"""
+    def rebuild_indices(self, full: bool = False):
+        """Rebuild both BM25 and vector search indices (`full` re-encodes every vector)"""
         print("Rebuilding search indices...")
         bm25_search.rebuild_index()
-        vector_search.rebuild_index()
+        vector_search.rebuild_index(full=full)
         print("Search indices rebuilt successfully!")
 
 
@@ -12,21 +12,116 @@ from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+import json
 import sys
+import numpy as np
+import torch
+
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from shared.config_loader import config
 from shared.database import db
+from shared.lazy import LazyProxy
 from services.retrieval_service.parameter_extraction import parameter_extractor
+from services.retrieval_service.faiss_store import FaissClient
+
+
+@lru_cache(maxsize=4)
+def _get_chroma_client(persist_dir: str, telemetry: bool) -> chromadb.PersistentClient:
+    """Return one shared ChromaDB client per persist directory"""
+    return chromadb.PersistentClient(
+        path=persist_dir,
+        settings=Settings(
+            anonymized_telemetry=telemetry,
+            allow_reset=True
+        )
+    )
+
+
+def _configure_torch_threads():
+    """Use every core for intra-op work and a single inter-op thread for CPU inference"""
+    torch.set_num_threads(os.cpu_count() or 1)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set once, before any inter-op parallel work has started
+        pass
+
+
+class ONNXEmbeddingModel:
+    """
+    ONNX Runtime encoder exposing the subset of SentenceTransformer.encode used here
+
+    Export once with:
+        optimum-cli export onnx --model BAAI/bge-m3 --task feature-extraction ./models/embedding/bge-m3-onnx
+    and optionally quantize to INT8 (model_quantized.onnx) with ORTQuantizer.
+    """
+
+    def __init__(self, model_path: Path, max_length: int = 512):
+        file_name = "model_quantized.onnx" if (model_path / "model_quantized.onnx").exists() else "model.onnx"
+        self.model = ORTModelForFeatureExtraction.from_pretrained(str(model_path), file_name=file_name)
+        self.tokenizer = AutoTokenizer.from_pretrained(str(model_path))
+        self.max_length = max_length
+
+        # BGE models use CLS pooling; honour a sentence-transformers pooling config if present
+        self.pooling = "cls"
+        pooling_config = model_path / "1_Pooling" / "config.json"
+        if pooling_config.exists():
+            with open(pooling_config, 'r', encoding='utf-8') as f:
+                if json.load(f).get("pooling_mode_mean_tokens"):
+                    self.pooling = "mean"
+
+    def encode(self, texts: List[str], batch_size: int = 32, normalize_embeddings: bool = True,
+               show_progress_bar: bool = False, convert_to_numpy: bool = True) -> np.ndarray:
+        """Encode texts to a (len(texts), dim) float32 array (always numpy)"""
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+            hidden = self.model(**inputs).last_hidden_state
+            hidden = np.asarray(hidden, dtype=np.float32)
+
+            if self.pooling == "mean":
+                mask = inputs["attention_mask"][..., None].astype(np.float32)
+                pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            else:
+                pooled = hidden[:, 0]
+
+            batches.append(pooled)
+
+        embeddings = np.concatenate(batches) if batches else np.zeros((0, 0), dtype=np.float32)
+
+        if normalize_embeddings and len(embeddings):
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+
+        return embeddings
 
 
 class EmbeddingModel:
     """Wrapper for embedding models with model switching capability"""
 
-    def __init__(self, model_name: str = "BAAI/bge-m3", device: str = "cpu"):
+    def __init__(self, model_name: str = "BAAI/bge-m3", device: str = "cpu", max_length: int = 512,
+                 encode_processes: int = 1):
         self.model_name = model_name
         self.device = device
+        self.max_length = max_length
+        self.encode_processes = encode_processes
         self.model = None
+        self._pool = None
         self._load_model()
 
     def _load_model(self):
@@ -34,8 +129,13 @@ class EmbeddingModel:
         # Check for local model first
         project_root = Path(__file__).parent.parent.parent
         local_model_path = project_root / "models" / "embedding" / self.model_name.split('/')[-1]
+        onnx_model_path = local_model_path.parent / f"{local_model_path.name}-onnx"
 
-        if local_model_path.exists() and any(local_model_path.iterdir()):
+        # Prefer an exported ONNX model on CPU (falls back to PyTorch if missing)
+        if self.device == "cpu" and ONNX_AVAILABLE and onnx_model_path.exists() and any(onnx_model_path.glob("*.onnx")):
+            print(f"Loading ONNX embedding model from local path: {onnx_model_path}")
+            self.model = ONNXEmbeddingModel(onnx_model_path, max_length=self.max_length)
+        elif local_model_path.exists() and any(local_model_path.iterdir()):
             print(f"Loading embedding model from local path: {local_model_path}")
             self.model = SentenceTransformer(str(local_model_path), device=self.device)
         else:
@@ -43,29 +143,87 @@ class EmbeddingModel:
             print(f"(To use local model, place files in: {local_model_path})")
             self.model = SentenceTransformer(self.model_name, device=self.device)
 
+        if isinstance(self.model, SentenceTransformer):
+            self.model.eval()
+        if self.device == "cpu":
+            _configure_torch_threads()
+
+        # Identifies the vector space: stored with every indexed document so a
+        # rebuild can tell vectors from another model/backend apart
+        if isinstance(self.model, SentenceTransformer):
+            backend = "torch"
+            dimension = self.model.get_sentence_embedding_dimension()
+        else:
+            backend = "onnx"
+            dimension = None
+        if not dimension:
+            dimension = len(self.encode(["dimension probe"])[0])
+        self.signature = f"{self.model_name}|{backend}|{dimension}"
+
         print(f"Embedding model loaded successfully!")
 
-    def encode(self, texts: List[str], normalize: bool = True) -> List[List[float]]:
+    def encode(self, texts: List[str], normalize: bool = True, batch_size: int = 32) -> np.ndarray:
         """
         Encode texts to embeddings
 
         Args:
             texts: List of texts to encode
             normalize: Whether to normalize embeddings
+            batch_size: Mini-batch size used by the underlying model
 
         Returns:
-            List of embeddings
+            (len(texts), dim) float32 array of embeddings
         """
         if self.model is None:
             self._load_model()
 
-        embeddings = self.model.encode(
-            texts,
-            normalize_embeddings=normalize,
-            show_progress_bar=False
-        )
+        if self._pool is not None:
+            embeddings = self.model.encode_multi_process(texts, self._pool, batch_size=batch_size)
+        else:
+            # No autograd bookkeeping on the query/indexing path
+            with torch.inference_mode():
+                embeddings = self.model.encode(
+                    texts,
+                    batch_size=batch_size,
+                    normalize_embeddings=False,
+                    show_progress_bar=False,
+                    convert_to_numpy=True
+                )
+
+        if normalize and len(embeddings):
+            # L2-normalize in place on the numpy buffer instead of inside torch
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            np.divide(embeddings, np.clip(norms, 1e-12, None), out=embeddings)
+
+        return embeddings
+
+    def start_pool(self) -> bool:
+        """
+        Start a multi-process encoding pool for bulk encoding
+
+        Uses one worker per GPU when more than one is available, otherwise
+        `encode_processes` CPU workers. Returns False when a pool isn't worthwhile.
+        """
+        if self._pool is not None:
+            return True
+        if not hasattr(self.model, 'start_multi_process_pool'):
+            return False
+
+        if torch.cuda.device_count() > 1:
+            target_devices = [f"cuda:{i}" for i in range(torch.cuda.device_count())]
+        elif self.encode_processes > 1:
+            target_devices = ["cpu"] * self.encode_processes
+        else:
+            return False
 
-        return embeddings.tolist()
+        self._pool = self.model.start_multi_process_pool(target_devices=target_devices)
+        return True
+
+    def stop_pool(self):
+        """Stop the multi-process encoding pool if one is running"""
+        if self._pool is not None:
+            self.model.stop_multi_process_pool(self._pool)
+            self._pool = None
 
     def switch_model(self, model_name: str, device: str = None):
         """Switch to a different embedding model"""
@@ -74,6 +232,7 @@ class EmbeddingModel:
             self.device = device
 
         # Unload current model
+        self.stop_pool()
         if self.model is not None:
             del self.model
 
@@ -81,6 +240,78 @@ class EmbeddingModel:
         self._load_model()
 
 
+class QueryCache:
+    """
+    Two-level cache for raw ChromaDB query results
+
+    Level 1 is an exact-string LRU keyed by (query, n_results).
+    Level 2 matches new query embeddings against recently seen ones by cosine
+    similarity (embeddings are normalized, so a dot product suffices).
+    Only the raw hits are cached; FAQ/Intent rows and extracted parameters are
+    still resolved per query so results never go stale against the database.
+    """
+
+    def __init__(self, max_size: int = 2048, semantic_size: int = 1024, threshold: float = 0.97):
+        self.max_size = max_size
+        self.semantic_size = semantic_size
+        self.threshold = threshold
+        self.clear()
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._exact = OrderedDict()
+        # Fixed-size ring buffer of recent query embeddings, allocated on the
+        # first put once the embedding dimension is known
+        self._embeddings = None  # (semantic_size, dim) float32
+        self._semantic_keys = np.full(max(self.semantic_size, 0), -1, dtype=np.int64)  # n_results per slot
+        self._semantic_results = [None] * max(self.semantic_size, 0)
+        self._next = 0  # Slot the next put overwrites
+        self._filled = 0  # Number of occupied slots
+
+    def get(self, query: str, n_results: int) -> Optional[Dict]:
+        """Exact-string lookup"""
+        key = (query, n_results)
+        results = self._exact.get(key)
+        if results is not None:
+            self._exact.move_to_end(key)
+        return results
+
+    def get_similar(self, embedding: np.ndarray, n_results: int) -> Optional[Dict]:
+        """Return results cached for a near-duplicate query embedding, if any"""
+        if not self._filled:
+            return None
+
+        sims = self._embeddings[:self._filled] @ embedding
+        sims[self._semantic_keys[:self._filled] != n_results] = -np.inf
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            return None
+        return self._semantic_results[best]
+
+    def put(self, query: str, n_results: int, embedding: np.ndarray, results: Dict,
+            semantic: bool = True):
+        """
+        Insert into the exact LRU and, unless `semantic` is False (the results
+        came from a semantic hit and are already stored), the embedding ring
+        buffer; the oldest entries are evicted when full
+        """
+        self._exact[(query, n_results)] = results
+        if len(self._exact) > self.max_size:
+            self._exact.popitem(last=False)
+
+        if not semantic or self.semantic_size <= 0:
+            return
+
+        if self._embeddings is None:
+            self._embeddings = np.zeros((self.semantic_size, embedding.shape[0]), dtype=np.float32)
+
+        slot = self._next
+        self._embeddings[slot] = embedding
+        self._semantic_keys[slot] = n_results
+        self._semantic_results[slot] = results
+        self._next = (slot + 1) % self.semantic_size
+        self._filled = min(self._filled + 1, self.semantic_size)
+
 class VectorSearch:
     """Vector-based semantic search using ChromaDB"""
 
@@ -92,7 +323,9 @@ class VectorSearch:
         # Initialize embedding model
         self.embedding_model = EmbeddingModel(
             model_name=embedding_config.get('model_name', 'BAAI/bge-m3'),
-            device=embedding_config.get('device', 'cpu')
+            device=embedding_config.get('device', 'cpu'),
+            max_length=embedding_config.get('max_length', 512),
+            encode_processes=embedding_config.get('encode_processes', 1)
         )
 
         # Initialize ChromaDB
@@ -101,14 +334,16 @@ class VectorSearch:
         # Ensure directory exists
         Path(persist_dir).mkdir(parents=True, exist_ok=True)
 
-        # Create ChromaDB client
-        self.client = chromadb.PersistentClient(
-            path=persist_dir,
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True
+        # Create vector store client (ChromaDB by default, FAISS HNSW-SQ8 optionally)
+        if vector_config.get('type', 'chromadb') == 'faiss':
+            self.client = FaissClient(
+                path=persist_dir,
+                m=vector_config.get('faiss_hnsw_m', 32),
+                ef_search=vector_config.get('faiss_ef_search', 64),
+                compact_ratio=vector_config.get('faiss_compact_ratio', 0.2)
             )
-        )
+        else:
+            self.client = _get_chroma_client(str(persist_dir), False)
 
         # Collection name
         self.collection_name = vector_config.get('collection_name', 'faq_embeddings')
@@ -124,46 +359,133 @@ class VectorSearch:
             )
             print(f"Created new collection: {self.collection_name}")
 
-    def add_faq(self, answer_id: str, question: str, alternative_questions: List[str], metadata: Dict = None):
-        """
-        Add FAQ to vector database
+        # Cache of raw query results (cleared whenever the collection changes)
+        self.query_cache = QueryCache(
+            max_size=vector_config.get('query_cache_size', 2048),
+            semantic_size=vector_config.get('semantic_cache_size', 1024),
+            threshold=vector_config.get('semantic_cache_threshold', 0.97)
+        )
 
-        Args:
-            answer_id: Unique answer ID
-            question: Main question text
-            alternative_questions: List of alternative question texts
-            metadata: Additional metadata
-        """
+        self.persist_dir = persist_dir
+        self._warm_up()
+
+    def _warm_up(self):
+        """Page the HNSW index into memory so the first real query doesn't hit disk"""
+        # Ask the kernel to prefetch the HNSW segment files
+        if hasattr(os, 'posix_fadvise'):
+            for path in Path(self.persist_dir).glob('*/*.bin'):
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                    try:
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                    finally:
+                        os.close(fd)
+                except OSError:
+                    pass
+
+        # Run one query to load the segment and touch its neighbor lists
+        try:
+            count = self.collection.count()
+            if count > 0:
+                embedding = self.embedding_model.encode(["warm up"])[0]
+                self.collection.query(
+                    query_embeddings=[embedding.tolist()],
+                    n_results=min(100, count)
+                )
+        except Exception as e:
+            print(f"Warning: Vector index warm-up failed: {e}")
+
+    def _faq_documents(self, answer_id: str, question: str, alternative_questions: List[str],
+                       metadata: Dict = None) -> Tuple[List[str], List[str], List[Dict]]:
+        """Build (ids, documents, metadatas) for an FAQ and its alternative questions"""
         # Prepare all questions
         all_questions = [question] + alternative_questions
 
         # Generate IDs for each question variant
         ids = [f"faq_{answer_id}_main"] + [f"faq_{answer_id}_alt_{i}" for i in range(len(alternative_questions))]
 
-        # Encode questions
-        embeddings = self.embedding_model.encode(all_questions)
+        # Prepare metadata from one shared template
+        template = {'type': 'faq', 'answer_id': answer_id}
+        if metadata:
+            template.update(metadata)
 
-        # Prepare metadata
         metadatas = []
         for i, q in enumerate(all_questions):
-            meta = {
-                'type': 'faq',
-                'answer_id': answer_id,
-                'question': q,
-                'is_alternative': i > 0
-            }
-            if metadata:
-                meta.update(metadata)
+            meta = template.copy()
+            meta['question'] = q
+            meta['is_alternative'] = i > 0
+            metadatas.append(meta)
+
+        return ids, all_questions, metadatas
+
+    def _intent_documents(self, intent_id: str, intent_name: str, trigger_phrases: List[str],
+                          action_type: str, action_config: Dict,
+                          metadata: Dict = None) -> Tuple[List[str], List[str], List[Dict]]:
+        """Build (ids, documents, metadatas) for an Intent's trigger phrases"""
+        # Generate IDs for each trigger phrase
+        ids = [f"intent_{intent_id}_phrase_{i}" for i in range(len(trigger_phrases))]
+
+        # Prepare metadata from one shared template
+        template = {
+            'type': 'intent',
+            'intent_id': intent_id,
+            'intent_name': intent_name,
+            'action_type': action_type,
+            'action_config': str(action_config)  # Store as string for ChromaDB
+        }
+        if metadata:
+            template.update(metadata)
+
+        metadatas = []
+        for phrase in trigger_phrases:
+            meta = template.copy()
+            meta['trigger_phrase'] = phrase
             metadatas.append(meta)
 
-        # Add to collection
+        return ids, list(trigger_phrases), metadatas
+
+    def _add_documents(self, ids: List[str], documents: List[str], metadatas: List[Dict]):
+        """Encode documents and add them to the collection in one call"""
+        # Sort by length so each mini-batch pads to a similar length, then restore order
+        order = sorted(range(len(documents)), key=lambda i: len(documents[i]))
+        sorted_embeddings = self.embedding_model.encode(
+            [documents[i] for i in order],
+            batch_size=64
+        )
+        embeddings = sorted_embeddings[np.argsort(order)]
+
+        for metadata in metadatas:
+            metadata['embedding_model'] = self.embedding_model.signature
+
+        # Add to collection (chromadb 0.4 only accepts nested lists)
         self.collection.add(
             ids=ids,
-            embeddings=embeddings,
-            documents=all_questions,
+            embeddings=embeddings.tolist(),
+            documents=documents,
             metadatas=metadatas
         )
 
+    def _persist(self):
+        """Write pending collection changes to disk (ChromaDB persists on its own)"""
+        persist = getattr(self.collection, 'persist', None)
+        if persist is not None:
+            persist()
+
+    def add_faq(self, answer_id: str, question: str, alternative_questions: List[str], metadata: Dict = None):
+        """
+        Add FAQ to vector database
+
+        Args:
+            answer_id: Unique answer ID
+            question: Main question text
+            alternative_questions: List of alternative question texts
+            metadata: Additional metadata
+        """
+        ids, documents, metadatas = self._faq_documents(answer_id, question, alternative_questions, metadata)
+        self._add_documents(ids, documents, metadatas)
+        self._persist()
+        self.query_cache.clear()
+
     def add_intent(self, intent_id: str, intent_name: str, trigger_phrases: List[str],
                    action_type: str, action_config: Dict, metadata: Dict = None):
         """
@@ -177,34 +499,49 @@ class VectorSearch:
             action_config: Action configuration
             metadata: Additional metadata
         """
-        # Generate IDs for each trigger phrase
-        ids = [f"intent_{intent_id}_phrase_{i}" for i in range(len(trigger_phrases))]
+        ids, documents, metadatas = self._intent_documents(
+            intent_id, intent_name, trigger_phrases, action_type, action_config, metadata
+        )
+        self._add_documents(ids, documents, metadatas)
+        self._persist()
+        self.query_cache.clear()
 
-        # Encode trigger phrases
-        embeddings = self.embedding_model.encode(trigger_phrases)
+    @staticmethod
+    def _dedupe_hits(metadatas: List[Dict], distances: List[float]) -> Tuple[List[Tuple], List[str], List[str]]:
+        """
+        Keep the first (best-ranked) hit per answer_id / intent_id
 
-        # Prepare metadata
-        metadatas = []
-        for i, phrase in enumerate(trigger_phrases):
-            meta = {
-                'type': 'intent',
-                'intent_id': intent_id,
-                'intent_name': intent_name,
-                'trigger_phrase': phrase,
-                'action_type': action_type,
-                'action_config': str(action_config)  # Store as string for ChromaDB
-            }
-            if metadata:
-                meta.update(metadata)
-            metadatas.append(meta)
+        Returns:
+            (hits, faq_ids, intent_ids) where hits are (doc_type, entity_id, metadata, similarity)
+        """
+        # Convert distance to similarity score (for cosine distance) in one vector op
+        # ChromaDB returns distance, we want similarity (1 - distance)
+        similarities = (1.0 - np.asarray(distances, dtype=np.float64)).tolist()
 
-        # Add to collection
-        self.collection.add(
-            ids=ids,
-            embeddings=embeddings,
-            documents=trigger_phrases,
-            metadatas=metadatas
-        )
+        hits = []
+        seen_ids = set()  # Track both answer_ids and intent_ids
+        faq_ids = []
+        intent_ids = []
+
+        for metadata, similarity in zip(metadatas, similarities):
+            doc_type = metadata.get('type', 'faq')
+
+            if doc_type == 'faq':
+                entity_id = metadata['answer_id']
+                target = faq_ids
+            elif doc_type == 'intent':
+                entity_id = metadata['intent_id']
+                target = intent_ids
+            else:
+                continue
+
+            if entity_id in seen_ids:
+                continue
+            seen_ids.add(entity_id)
+            target.append(entity_id)
+            hits.append((doc_type, entity_id, metadata, similarity))
+
+        return hits, faq_ids, intent_ids
 
     def search(self, query: str, top_k: int = 10) -> List[Dict]:
         """
@@ -217,84 +554,74 @@ class VectorSearch:
         Returns:
             List of search results with scores (FAQs and Intents)
         """
-        # Encode query
-        query_embedding = self.embedding_model.encode([query])[0]
+        n_results = top_k * 2  # Get more results to handle deduplication
+
+        results = self.query_cache.get(query, n_results)
+        if results is None:
+            # Encode query
+            query_embedding = self.embedding_model.encode([query])[0]
+
+            results = self.query_cache.get_similar(query_embedding, n_results)
+            semantic_hit = results is not None
+            if not semantic_hit:
+                # Search in ChromaDB (converted to a list only when actually querying)
+                results = self.collection.query(
+                    query_embeddings=[query_embedding.tolist()],
+                    n_results=n_results
+                )
+            self.query_cache.put(query, n_results, query_embedding, results, semantic=not semantic_hit)
+
+        # First pass: deduplicate hits (keep highest score per answer_id / intent_id)
+        hits, faq_ids, intent_ids = [], [], []
+        if results['ids'] and len(results['ids']) > 0:
+            hits, faq_ids, intent_ids = self._dedupe_hits(results['metadatas'][0], results['distances'][0])
 
-        # Search in ChromaDB
-        results = self.collection.query(
-            query_embeddings=[query_embedding],
-            n_results=top_k * 2  # Get more results to handle deduplication
-        )
+        # Second pass: fetch all referenced FAQs and Intents in one query each
+        faqs = db.get_faqs_by_ids(faq_ids) if faq_ids else {}
+        intents = db.get_intents_by_ids(intent_ids) if intent_ids else {}
 
-        # Process results
+        # Third pass: assemble results in ranking order
         search_results = []
-        seen_ids = set()  # Track both answer_ids and intent_ids
-
-        if results['ids'] and len(results['ids']) > 0:
-            for i, doc_id in enumerate(results['ids'][0]):
-                metadata = results['metadatas'][0][i]
-                distance = results['distances'][0][i]
-                doc_type = metadata.get('type', 'faq')
-
-                # Convert distance to similarity score (for cosine distance)
-                # ChromaDB returns distance, we want similarity (1 - distance)
-                similarity = 1 - distance
-
-                if doc_type == 'faq':
-                    # FAQ result
-                    answer_id = metadata['answer_id']
-
-                    # Deduplicate by answer_id (keep highest score)
-                    if answer_id not in seen_ids:
-                        seen_ids.add(answer_id)
-
-                        # Get full FAQ from database
-                        faq = db.get_faq_by_id(answer_id)
-
-                        if faq:
-                            search_results.append({
-                                'type': 'faq',
-                                'answer_id': answer_id,
-                                'question': faq.question,
-                                'answer': faq.answer,
-                                'audio_path': faq.audio_path,
-                                'language': faq.language,
-                                'score': float(similarity),
-                                'matched_question': metadata['question'],
-                                'is_alternative': metadata.get('is_alternative', False)
-                            })
-
-                elif doc_type == 'intent':
-                    # Intent result
-                    intent_id = metadata['intent_id']
-
-                    # Deduplicate by intent_id (keep highest score)
-                    if intent_id not in seen_ids:
-                        seen_ids.add(intent_id)
-
-                        # Get full intent from database
-                        intent = db.get_intent_by_id(intent_id)
-
-                        if intent:
-                            # Extract parameters from query using all trigger phrases
-                            matched, phrase, parameters = parameter_extractor.match_and_extract(
-                                query, intent.trigger_phrases
-                            )
-                            matched_phrase = phrase if matched else metadata['trigger_phrase']
-
-                            search_results.append({
-                                'type': 'intent',
-                                'intent_id': intent_id,
-                                'intent_name': intent.intent_name,
-                                'description': intent.description,
-                                'matched_phrase': matched_phrase,
-                                'action_type': intent.action_type,
-                                'action_config': intent.action_config,
-                                'language': intent.language,
-                                'category': intent.category,
-                                'score': float(similarity),
-                                'parameters': parameters  # Extracted parameters
-                            })
+        for doc_type, entity_id, metadata, similarity in hits:
+            if doc_type == 'faq':
+                faq = faqs.get(entity_id)
+
+                if faq:
+                    search_results.append({
+                        'type': 'faq',
+                        'answer_id': entity_id,
+                        'question': faq.question,
+                        'answer': faq.answer,
+                        'audio_path': faq.audio_path,
+                        'language': faq.language,
+                        'score': similarity,
+                        'matched_question': metadata['question'],
+                        'is_alternative': metadata.get('is_alternative', False)
+                    })
+
+            else:
+                intent = intents.get(entity_id)
+
+                if intent:
+                    # Extract parameters from query using all trigger phrases
+                    matched, phrase, parameters = parameter_extractor.match_and_extract(
+                        query, intent.trigger_phrases
+                    )
+                    matched_phrase = phrase if matched else metadata['trigger_phrase']
+
+                    search_results.append({
+                        'type': 'intent',
+                        'intent_id': entity_id,
+                        'intent_name': intent.intent_name,
+                        'description': intent.description,
+                        'matched_phrase': matched_phrase,
+                        'action_type': intent.action_type,
+                        'action_config': intent.action_config,
+                        'language': intent.language,
+                        'category': intent.category,
+                        'score': similarity,
+                        'parameters': parameters  # Extracted parameters
+                    })
 
         # Return top_k results after deduplication
         return search_results[:top_k]
@@ -322,59 +649,151 @@ class VectorSearch:
 
     def delete_faq(self, answer_id: str):
         """Delete FAQ from vector database"""
-        # Get all IDs related to this answer_id
-        results = self.collection.get(where={'answer_id': answer_id})
+        self.delete_many([answer_id])
+
+    def delete_many(self, answer_ids: List[str]):
+        """Delete several FAQs from the vector database with one get and one delete"""
+        if not answer_ids:
+            return
+
+        # Get all IDs related to these answer_ids
+        results = self.collection.get(where={'answer_id': {'$in': list(answer_ids)}})
 
         if results['ids']:
             self.collection.delete(ids=results['ids'])
+            self._persist()
+            self.query_cache.clear()
 
-    def rebuild_index(self):
-        """Rebuild entire vector index from database with FAQs and Intents"""
-        # Clear existing collection
-        self.client.delete_collection(name=self.collection_name)
-
-        # Recreate collection
-        vector_config = config.get_section('vector_db')
-        self.collection = self.client.create_collection(
-            name=self.collection_name,
-            metadata={"hnsw:space": vector_config.get('distance_metric', 'cosine')}
-        )
+    @staticmethod
+    def _content_hash(document: str, metadata: Dict, signature: str) -> str:
+        """Stable hash of a document, its metadata and the embedding model, used to skip unchanged rows on rebuild"""
+        payload = json.dumps([document, metadata, signature], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
 
-        # Get all FAQs
-        faqs = db.get_all_faqs()
+    def rebuild_index(self, full: bool = False):
+        """
+        Rebuild vector index from database with FAQs and Intents
 
-        # Get all Intents
-        intents = db.get_all_intents()
+        By default only documents that were added, changed or removed since the
+        last build are touched. `full=True` drops and recreates the collection,
+        which also happens automatically when any indexed vector was produced by
+        a different embedding model, backend or dimension.
+        """
+        vector_config = config.get_section('vector_db')
 
-        print(f"Rebuilding vector index with {len(faqs)} FAQs and {len(intents)} Intents...")
+        signature = self.embedding_model.signature
+        existing = {'ids': [], 'metadatas': []}
+        if not full:
+            existing = self.collection.get(include=['metadatas'])
+            if any((meta or {}).get('embedding_model') != signature for meta in existing['metadatas']):
+                print("Embedding model changed since the last build, rebuilding the full vector index...")
+                full = True
+                existing = {'ids': [], 'metadatas': []}
 
-        # Add each FAQ
-        for faq in faqs:
-            self.add_faq(
-                answer_id=faq.answer_id,
-                question=faq.question,
-                alternative_questions=faq.alternative_questions,
-                metadata={
-                    'language': faq.language,
-                    'category': faq.category
-                }
-            )
+        if full:
+            # Clear existing collection
+            self.client.delete_collection(name=self.collection_name)
 
-        # Add each Intent
-        for intent in intents:
-            self.add_intent(
-                intent_id=intent.intent_id,
-                intent_name=intent.intent_name,
-                trigger_phrases=intent.trigger_phrases,
-                action_type=intent.action_type,
-                action_config=intent.action_config,
-                metadata={
-                    'language': intent.language,
-                    'category': intent.category,
-                    'description': intent.description
-                }
+            # Recreate collection
+            self.collection = self.client.create_collection(
+                name=self.collection_name,
+                metadata={"hnsw:space": vector_config.get('distance_metric', 'cosine')}
             )
 
+        # Refresh the database's FAQ/Intent cache along with the index
+        db.reload()
+
+        # Content hash of every document currently in the index
+        existing_hashes = {
+            doc_id: (meta or {}).get('content_hash')
+            for doc_id, meta in zip(existing['ids'], existing['metadatas'])
+        }
+        stale_ids = set(existing_hashes)
+
+        # Stream rows and encode/insert changed documents in bounded windows so
+        # peak memory stays O(batch_size * dim) rather than O(corpus * dim)
+        batch_size = vector_config.get('rebuild_batch_size', 512)
+        batch_ids, batch_documents, batch_metadatas = [], [], []
+        replaced_ids = []
+        faq_count = 0
+        intent_count = 0
+        added_count = 0
+
+        def collect(ids: List[str], documents: List[str], metadatas: List[Dict]):
+            for doc_id, document, metadata in zip(ids, documents, metadatas):
+                content_hash = self._content_hash(document, metadata, signature)
+                stale_ids.discard(doc_id)
+
+                if existing_hashes.get(doc_id) == content_hash:
+                    continue
+                if doc_id in existing_hashes:
+                    replaced_ids.append(doc_id)
+
+                metadata['content_hash'] = content_hash
+                batch_ids.append(doc_id)
+                batch_documents.append(document)
+                batch_metadatas.append(metadata)
+
+        def flush():
+            nonlocal batch_ids, batch_documents, batch_metadatas, replaced_ids, added_count
+            if replaced_ids:
+                self.collection.delete(ids=replaced_ids)
+            if batch_documents:
+                self._add_documents(batch_ids, batch_documents, batch_metadatas)
+                added_count += len(batch_documents)
+            batch_ids, batch_documents, batch_metadatas, replaced_ids = [], [], [], []
+
+        print("Rebuilding vector index with FAQs and Intents...")
+
+        # Shard bulk encoding across GPUs / CPU workers when configured
+        self.embedding_model.start_pool()
+        try:
+            for faq in db.iter_faqs():
+                collect(*self._faq_documents(
+                    answer_id=faq.answer_id,
+                    question=faq.question,
+                    alternative_questions=faq.alternative_questions,
+                    metadata={
+                        'language': faq.language,
+                        'category': faq.category
+                    }
+                ))
+                faq_count += 1
+
+                if len(batch_documents) >= batch_size:
+                    flush()
+
+            for intent in db.iter_intents():
+                collect(*self._intent_documents(
+                    intent_id=intent.intent_id,
+                    intent_name=intent.intent_name,
+                    trigger_phrases=intent.trigger_phrases,
+                    action_type=intent.action_type,
+                    action_config=intent.action_config,
+                    metadata={
+                        'language': intent.language,
+                        'category': intent.category,
+                        'description': intent.description
+                    }
+                ))
+                intent_count += 1
+
+                if len(batch_documents) >= batch_size:
+                    flush()
+
+            flush()
+        finally:
+            self.embedding_model.stop_pool()
+
+        # Remove documents whose FAQ/Intent (or variant) no longer exists
+        if stale_ids:
+            self.collection.delete(ids=list(stale_ids))
+
+        self._persist()
+        self.query_cache.clear()
+
+        print(f"Indexed {faq_count} FAQs and {intent_count} Intents "
+              f"({added_count} documents re-encoded, {len(stale_ids)} removed)")
         print(f"Vector index rebuilt successfully!")
 
     def count_documents(self) -> int:
@@ -382,5 +801,5 @@ class VectorSearch:
         return self.collection.count()
 
 
-# Global vector search instance
-vector_search = VectorSearch()
+# Global vector search instance (embedding model and index load on first use)
+vector_search = LazyProxy(VectorSearch)
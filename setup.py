@@ -0,0 +1,30 @@
+"""
+Optional build step for SpeakSense
+Compiles shared/models.py to a C extension with Cython:
+
+    python setup.py build_ext --inplace
+
+The compiled module is picked up ahead of models.py on import; when it is
+absent (or Cython is not installed) the pure-Python source is used as-is.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["shared/models.py"],
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            # Keep annotations as plain metadata so pydantic still sees them
+            "annotation_typing": False,
+        },
+    )
+except ImportError:
+    ext_modules = []
+
+setup(
+    name="speaksense",
+    packages=["shared"],
+    ext_modules=ext_modules,
+)
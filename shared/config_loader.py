@@ -7,12 +7,21 @@ import os
 from pathlib import Path
 from typing import Dict, Any
 
+from .lazy import LazyProxy
+
+# C-accelerated loader when libyaml is available
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_MISSING = object()
+
 
 class ConfigLoader:
     """Singleton configuration loader"""
 
     _instance = None
     _config = None
+    _cache: Dict[str, Any] = {}
+    _section_cache: Dict[str, Dict[str, Any]] = {}
 
     def __new__(cls):
         if cls._instance is None:
@@ -34,12 +43,20 @@ class ConfigLoader:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
         with open(config_path, 'r', encoding='utf-8') as f:
-            self._config = yaml.safe_load(f)
+            self._config = yaml.load(f, Loader=SafeLoader)
+
+        # Invalidate memoized lookups
+        self._cache = {}
+        self._section_cache = {}
 
         return self._config
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by dot-notation key (e.g., 'asr.model_name')"""
+        value = self._cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
         if self._config is None:
             self.load_config()
 
@@ -52,14 +69,24 @@ class ConfigLoader:
             else:
                 return default
 
+        self._cache[key] = value
         return value
 
     def get_section(self, section: str) -> Dict[str, Any]:
         """Get entire configuration section"""
+        cached = self._section_cache.get(section)
+        if cached is not None:
+            return cached
+
         if self._config is None:
             self.load_config()
 
-        return self._config.get(section, {})
+        value = self._config.get(section)
+        if value is None:
+            return {}
+
+        self._section_cache[section] = value
+        return value
 
     @property
     def config(self) -> Dict[str, Any]:
@@ -69,5 +96,5 @@ class ConfigLoader:
         return self._config
 
 
-# Global config instance
-config = ConfigLoader()
+# Global config instance (loaded on first use)
+config = LazyProxy(ConfigLoader)
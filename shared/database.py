@@ -4,13 +4,227 @@ SQLite database management for FAQ storage
 """
 import sqlite3
 import json
-from typing import List, Optional, Dict
-from datetime import datetime
+import threading
+import queue
+import time
+import atexit
+from contextlib import contextmanager
+from typing import List, Optional, Dict, Iterator, Tuple
+from datetime import datetime, date, timedelta
 from pathlib import Path
-import uuid
+import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .config_loader import config
 from .models import FAQEntry, IntentEntry
+from .lazy import LazyProxy
+
+
+if ORJSON_AVAILABLE:
+    def _json_dumps(obj) -> str:
+        """Serialize to a JSON string (orjson keeps non-ASCII characters as-is)"""
+        return orjson.dumps(obj).decode('utf-8')
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> str:
+        """Serialize to a JSON string without escaping non-ASCII characters"""
+        return json.dumps(obj, ensure_ascii=False)
+
+    _json_loads = json.loads
+
+
+# Bump whenever init_db's DDL changes so existing databases re-run it once
+_SCHEMA_VERSION = 2
+
+# Rows fetched per step by the C layer when streaming results
+_FETCH_ARRAYSIZE = 1000
+
+
+def _now() -> str:
+    """Current local time as stored in TIMESTAMP columns ('YYYY-MM-DD HH:MM:SS.ffffff')"""
+    return datetime.now().isoformat(' ')
+
+
+def _new_id() -> str:
+    """Random 128-bit opaque primary key as 32 hex characters"""
+    return os.urandom(16).hex()
+
+
+# Updatable columns and the transform applied to their values, in statement order
+_FAQ_UPDATE_FIELDS = (
+    ('question', None),
+    ('answer', None),
+    ('alternative_questions', _json_dumps),
+    ('language', None),
+    ('category', None),
+    ('audio_path', None),
+    ('audio_status', None)
+)
+_INTENT_UPDATE_FIELDS = (
+    ('intent_name', None),
+    ('description', None),
+    ('trigger_phrases', _json_dumps),
+    ('action_type', None),
+    ('action_config', _json_dumps),
+    ('language', None),
+    ('category', None)
+)
+
+
+def _sql_coalesce_update(table: str, fields: tuple, key: str) -> str:
+    """Static UPDATE where a NULL parameter keeps the column's current value"""
+    assignments = ''.join(f'        {name} = COALESCE(?, {name}),\n' for name, _ in fields)
+    return f'''
+    UPDATE {table} SET
+{assignments}        updated_at = ?
+    WHERE {key} = ?
+'''
+
+
+def _update_params(fields: tuple, updates: Dict) -> tuple:
+    """Bind values for a _sql_coalesce_update statement (absent fields bind NULL)"""
+    values = []
+    for name, transform in fields:
+        value = updates.get(name)
+        values.append(transform(value) if transform is not None and value is not None else value)
+    return tuple(values)
+
+
+# ========================================
+# SQL statements
+# ========================================
+
+# UPDATE ... RETURNING (SQLite 3.35+) writes and reads back the row in one statement
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+# Kept as module-level constants so every call passes the identical text and
+# hits the connection's prepared-statement cache instead of re-parsing.
+
+_SQL_GET_TABLE_VERSIONS = 'SELECT name, version FROM table_versions'
+
+# FAQ columns in FAQEntry argument order. FAQ reads name them explicitly so
+# rows unpack positionally: with SELECT * the order differs between new and
+# migrated tables (where ALTER TABLE appended audio_status).
+_FAQ_COLUMNS = (
+    'answer_id', 'question', 'answer', 'alternative_questions', 'language',
+    'category', 'audio_path', 'created_at', 'updated_at', 'audio_status'
+)
+_FAQ_SELECT = ', '.join(_FAQ_COLUMNS)
+
+_SQL_INSERT_FAQ = '''
+    INSERT INTO faq (
+        answer_id, question, answer, alternative_questions,
+        language, category, audio_path, audio_status, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_SQL_GET_FAQ_BY_ID = f'SELECT {_FAQ_SELECT} FROM faq WHERE answer_id = ?'
+_SQL_GET_FAQS_BY_IDS = f'SELECT {_FAQ_SELECT} FROM faq WHERE answer_id IN ({{placeholders}})'
+_SQL_LIST_FAQS = f'SELECT {_FAQ_SELECT} FROM faq ORDER BY created_at DESC'
+_SQL_UPDATE_FAQ = _sql_coalesce_update('faq', _FAQ_UPDATE_FIELDS, 'answer_id')
+_SQL_UPDATE_FAQ_RETURNING = _SQL_UPDATE_FAQ.rstrip() + f' RETURNING {_FAQ_SELECT}'
+_SQL_DELETE_FAQ = 'DELETE FROM faq WHERE answer_id = ?'
+# Alternative questions are matched element-wise so the JSON syntax itself never matches
+_SQL_FAQ_KEYWORD_FILTER = '''
+    (f.question LIKE ? OR f.answer LIKE ? OR EXISTS (
+        SELECT 1 FROM json_each(
+            CASE WHEN json_valid(f.alternative_questions) THEN f.alternative_questions END
+        )
+        WHERE value LIKE ?
+    ))
+'''
+# faq_fts indexes the raw alternative_questions JSON, so FTS hits are narrowed
+# with the same filter as the LIKE scan and both paths return the same rows
+_SQL_SEARCH_FAQS_FTS = f'''
+    SELECT {', '.join('f.' + column for column in _FAQ_COLUMNS)} FROM faq f
+    JOIN faq_fts s ON f.rowid = s.rowid
+    WHERE faq_fts MATCH ? AND {_SQL_FAQ_KEYWORD_FILTER.strip()}
+'''
+_SQL_SEARCH_FAQS_LIKE = f'''
+    SELECT {_FAQ_SELECT} FROM faq f
+    WHERE {_SQL_FAQ_KEYWORD_FILTER.strip()}
+'''
+
+_SQL_INSERT_INTENT = '''
+    INSERT INTO intent (
+        intent_id, intent_name, description, trigger_phrases,
+        action_type, action_config, language, category, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_SQL_GET_INTENT_BY_ID = 'SELECT * FROM intent WHERE intent_id = ?'
+_SQL_GET_INTENTS_BY_IDS = 'SELECT * FROM intent WHERE intent_id IN ({placeholders})'
+_SQL_GET_INTENT_BY_NAME = 'SELECT * FROM intent WHERE intent_name = ?'
+_SQL_LIST_INTENTS = 'SELECT * FROM intent ORDER BY created_at DESC'
+_SQL_UPDATE_INTENT = _sql_coalesce_update('intent', _INTENT_UPDATE_FIELDS, 'intent_id')
+_SQL_UPDATE_INTENT_RETURNING = _SQL_UPDATE_INTENT.rstrip() + ' RETURNING *'
+_SQL_DELETE_INTENT = 'DELETE FROM intent WHERE intent_id = ?'
+
+_SQL_INSERT_QUERY_LOG = '''
+    INSERT INTO query_logs (
+        log_id, query_text, matched_type, matched_id,
+        matched_question, confidence, response_time, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+# Query log dicts are zipped straight from rows selected in this column order.
+# rowid is the insertion order: it breaks ties between the logs of one flush
+# batch (which share created_at) and is the keyset cursor.
+_QUERY_LOG_COLUMNS = (
+    'log_id', 'query_text', 'matched_type', 'matched_id',
+    'matched_question', 'confidence', 'response_time', 'created_at', 'rowid'
+)
+_QUERY_LOG_SELECT = ', '.join(_QUERY_LOG_COLUMNS)
+_SQL_LIST_QUERY_LOGS = f'SELECT {_QUERY_LOG_SELECT} FROM query_logs ORDER BY created_at DESC, rowid DESC LIMIT ? OFFSET ?'
+_SQL_LIST_QUERY_LOGS_BY_TYPE = f'''
+    SELECT {_QUERY_LOG_SELECT} FROM query_logs WHERE matched_type = ?
+    ORDER BY created_at DESC, rowid DESC LIMIT ? OFFSET ?
+'''
+# Keyset pages: seek past the (created_at, rowid) of the previous page's last row
+_SQL_LIST_QUERY_LOGS_BEFORE = f'''
+    SELECT {_QUERY_LOG_SELECT} FROM query_logs WHERE (created_at, rowid) < (?, ?)
+    ORDER BY created_at DESC, rowid DESC LIMIT ?
+'''
+_SQL_LIST_QUERY_LOGS_BY_TYPE_BEFORE = f'''
+    SELECT {_QUERY_LOG_SELECT} FROM query_logs WHERE matched_type = ? AND (created_at, rowid) < (?, ?)
+    ORDER BY created_at DESC, rowid DESC LIMIT ?
+'''
+
+# All dashboard aggregates in one statement, as (kind, label, count, today, avg_time) rows:
+# one 'totals' row (the counters share a single pass over query_logs), the top 5
+# matched FAQ questions, one row per matched intent (both from idx_query_type_question)
+# and one per trend day
+_SQL_QUERY_STATS = '''
+    WITH totals AS (
+        SELECT
+            COUNT(*) AS total,
+            (SELECT COUNT(*) FROM query_logs WHERE created_at >= ? AND created_at < ?) AS today,
+            AVG(response_time) AS avg_time
+        FROM query_logs
+    )
+    SELECT 'totals' AS kind, NULL AS label, total AS count, today, avg_time FROM totals
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'faq', matched_question, COUNT(*) AS count, NULL, NULL
+        FROM query_logs
+        WHERE matched_type = 'faq' AND matched_question IS NOT NULL
+        GROUP BY matched_question
+        ORDER BY count DESC
+        LIMIT 5
+    )
+    UNION ALL
+    SELECT 'intent', matched_question, COUNT(*), NULL, NULL
+    FROM query_logs
+    WHERE matched_type = 'intent' AND matched_question IS NOT NULL
+    GROUP BY matched_question
+    UNION ALL
+    SELECT 'trend', DATE(created_at), COUNT(*), NULL, NULL
+    FROM query_logs
+    WHERE created_at >= ?
+    GROUP BY DATE(created_at)
+'''
 
 
 class Database:
@@ -29,11 +243,61 @@ class Database:
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
         self.db_path = str(db_path)
+        self.cache_size_kb = config.get('database.cache_size_kb', 64000)
+        self.mmap_size = config.get('database.mmap_size', 268435456)
+        self._local = threading.local()
+        # Connections are per thread; this process's writers queue on this lock
+        # instead of spinning in SQLite's busy handler
+        self._write_lock = threading.Lock()
         self.init_db()
 
+        # In-memory FAQ/Intent caches for the retrieval hot path
+        self._cache_lock = threading.Lock()
+        self.reload()
+
+        # Query logs are queued on the request path and written in batches
+        self.log_batch_size = config.get('database.log_batch_size', 500)
+        self.log_flush_interval = config.get('database.log_flush_interval', 0.25)
+        self.log_flush_timeout = config.get('database.log_flush_timeout', 5.0)
+        self._log_queue = queue.Queue()
+        self._log_flusher = threading.Thread(target=self._flush_query_logs_forever, daemon=True)
+        self._log_flusher.start()
+        atexit.register(self.flush)
+
+        # Dashboard aggregations, keyed by `days`: {days: (expires_at, stats)}
+        self.stats_cache_ttl = config.get('database.stats_cache_ttl', 30)
+        self._stats_cache: Dict[int, tuple] = {}
+        self._stats_lock = threading.Lock()
+
     def get_connection(self):
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
+        """Get this thread's persistent read-write connection (opened lazily)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._open_connection(self.db_path)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get_read_connection(self):
+        """Get this thread's persistent read-only connection (opened lazily)"""
+        conn = getattr(self._local, 'read_conn', None)
+        if conn is None:
+            try:
+                conn = self._open_connection(f'{Path(self.db_path).as_uri()}?mode=ro', uri=True)
+            except sqlite3.OperationalError:
+                # e.g. WAL files not creatable by a read-only opener; share the writer
+                conn = self.get_connection()
+            self._local.read_conn = conn
+        return conn
+
+    def _open_connection(self, database: str, uri: bool = False) -> sqlite3.Connection:
+        """Open a connection in autocommit mode with the per-connection pragmas applied"""
+        conn = sqlite3.connect(database, uri=uri, check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA temp_store=MEMORY')
+        # Negative cache_size is in KiB; both are per-connection, so set once here
+        conn.execute(f'PRAGMA cache_size=-{int(self.cache_size_kb)}')
+        conn.execute(f'PRAGMA mmap_size={int(self.mmap_size)}')
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -42,6 +306,15 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
 
+        # Schema already created by an earlier start: skip the DDL
+        cursor.execute('PRAGMA user_version')
+        if cursor.fetchone()[0] >= _SCHEMA_VERSION:
+            # The full integrity-check reads the whole index; only run it on request
+            self.fts_enabled = self._check_faq_fts(
+                cursor, integrity_check=config.get('database.fts_integrity_check', False)
+            )
+            return
+
         # Create FAQ table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS faq (
@@ -59,9 +332,9 @@ class Database:
         ''')
 
         # Migrate existing database: add audio_status column if it doesn't exist
-        try:
-            cursor.execute("SELECT audio_status FROM faq LIMIT 1")
-        except sqlite3.OperationalError:
+        cursor.execute("PRAGMA table_info(faq)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if 'audio_status' not in columns:
             # Column doesn't exist, add it
             cursor.execute("ALTER TABLE faq ADD COLUMN audio_status TEXT DEFAULT 'pending'")
             # Update existing FAQs with audio_path to 'completed'
@@ -124,12 +397,208 @@ class Database:
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_query_created_at ON query_logs(created_at)
         ''')
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_query_type_question'")
+        new_stats_indexes = cursor.fetchone() is None
+
+        # Covering index for the per-type GROUP BY matched_question aggregations
+        # (supersedes the single-column matched_type index)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_query_type_question ON query_logs(matched_type, matched_question)
+        ''')
+        cursor.execute('DROP INDEX IF EXISTS idx_query_matched_type')
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_query_matched_type ON query_logs(matched_type)
+            CREATE INDEX IF NOT EXISTS idx_query_created_date ON query_logs(DATE(created_at))
         ''')
+        if new_stats_indexes:
+            # Give the planner statistics so it picks the covering index
+            cursor.execute('ANALYZE query_logs')
 
+        # Per-table change counters, bumped by triggers so every process can
+        # tell when its in-memory FAQ/Intent cache is stale
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS table_versions (
+                name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute("INSERT OR IGNORE INTO table_versions (name) VALUES ('faq'), ('intent')")
+        for table in ('faq', 'intent'):
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()}
+                    AFTER {event} ON {table}
+                    BEGIN
+                        UPDATE table_versions SET version = version + 1 WHERE name = '{table}';
+                    END
+                ''')
+
+        self.fts_enabled = self._init_faq_fts(cursor)
+
+        cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
         conn.commit()
-        conn.close()
+
+    def _init_faq_fts(self, cursor) -> bool:
+        """Create the FTS5 index used by keyword search; returns False if FTS5 is unavailable"""
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'faq_fts'")
+        row = cursor.fetchone()
+
+        if row is not None and "content='faq'" not in row['sql']:
+            # Migrate the earlier standalone index (which stored its own copy of
+            # every FAQ) to an external-content index over the faq table
+            for trigger in ('faq_fts_insert', 'faq_fts_update', 'faq_fts_delete'):
+                cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+            cursor.execute('DROP TABLE faq_fts')
+            row = None
+
+        try:
+            # trigram keeps LIKE '%kw%' substring semantics, including for Chinese text
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS faq_fts USING fts5(
+                    question, answer, alternative_questions,
+                    content='faq', content_rowid='rowid',
+                    tokenize='trigram'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            print(f"Warning: FTS5 unavailable, keyword search falls back to LIKE scans: {e}")
+            return False
+
+        # Keep the index in sync with the faq table
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS faq_ai AFTER INSERT ON faq
+            BEGIN
+                INSERT INTO faq_fts (rowid, question, answer, alternative_questions)
+                VALUES (new.rowid, new.question, new.answer, new.alternative_questions);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS faq_ad AFTER DELETE ON faq
+            BEGIN
+                INSERT INTO faq_fts (faq_fts, rowid, question, answer, alternative_questions)
+                VALUES ('delete', old.rowid, old.question, old.answer, old.alternative_questions);
+            END
+        ''')
+        # UPDATE OF alone fires whenever the columns are assigned, and the static
+        # COALESCE update assigns them all; re-index only when a value changes
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'faq_au'")
+        trigger = cursor.fetchone()
+        if trigger is not None and 'WHEN' not in trigger['sql']:
+            cursor.execute('DROP TRIGGER faq_au')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS faq_au AFTER UPDATE OF question, answer, alternative_questions ON faq
+            WHEN old.question IS NOT new.question
+                OR old.answer IS NOT new.answer
+                OR old.alternative_questions IS NOT new.alternative_questions
+            BEGIN
+                INSERT INTO faq_fts (faq_fts, rowid, question, answer, alternative_questions)
+                VALUES ('delete', old.rowid, old.question, old.answer, old.alternative_questions);
+                INSERT INTO faq_fts (rowid, question, answer, alternative_questions)
+                VALUES (new.rowid, new.question, new.answer, new.alternative_questions);
+            END
+        ''')
+
+        if row is None:
+            # Index FAQs created before the index existed
+            cursor.execute("INSERT INTO faq_fts (faq_fts) VALUES ('rebuild')")
+            return True
+
+        return self._check_faq_fts(cursor)
+
+    def _check_faq_fts(self, cursor, integrity_check: bool = True) -> bool:
+        """Verify the FTS5 index matches the faq table; returns False if there is no index"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'faq_fts'")
+        if cursor.fetchone() is None:
+            return False
+        if not integrity_check:
+            return True
+
+        # faq has no INTEGER PRIMARY KEY, so VACUUM may renumber its rowids;
+        # re-index if the index no longer matches the table
+        try:
+            cursor.execute("INSERT INTO faq_fts (faq_fts, rank) VALUES ('integrity-check', 1)")
+        except sqlite3.DatabaseError:
+            cursor.execute("INSERT INTO faq_fts (faq_fts) VALUES ('rebuild')")
+
+        return True
+
+    # ========================================
+    # In-memory FAQ/Intent cache
+    # ========================================
+
+    def _get_table_versions(self) -> Dict[str, int]:
+        """Read the FAQ/Intent change counters"""
+        cursor = self.get_connection().cursor()
+        cursor.execute(_SQL_GET_TABLE_VERSIONS)
+        return {row['name']: row['version'] for row in cursor.fetchall()}
+
+    def reload(self):
+        """Reload the in-memory FAQ/Intent caches from the database"""
+        with self._cache_lock:
+            # Read versions first so changes made during the load trigger another reload
+            self._cache_versions = self._get_table_versions()
+            self._faq_cache = {faq.answer_id: faq for faq in self.get_all_faqs()}
+            self._intent_cache = {intent.intent_id: intent for intent in self.get_all_intents()}
+
+    @contextmanager
+    def _versioned_write(self):
+        """
+        Run FAQ/Intent writes in one transaction under the write lock
+
+        Yields (cursor, versions); versions receives the table_versions read
+        just before and after the writes inside the same transaction, so no
+        other connection's change can fall between them.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        with self._write_lock:
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                versions = {'before': self._get_table_versions()}
+                yield cursor, versions
+                versions['after'] = self._get_table_versions()
+                cursor.execute('COMMIT')
+            except BaseException:
+                if conn.in_transaction:
+                    cursor.execute('ROLLBACK')
+                raise
+
+    def _apply_cache_write(self, table: str, versions: Dict, entries: Dict):
+        """
+        Apply a committed write to the FAQ/Intent cache
+
+        `entries` maps ids to their new entry, or to None when removed. The
+        write's own version bump is recorded with it so other threads don't
+        reload; if the cache already missed another change it stays stale and
+        the next _sync_cache reloads it.
+        """
+        with self._cache_lock:
+            cache = self._faq_cache if table == 'faq' else self._intent_cache
+            for entry_id, entry in entries.items():
+                if entry is None:
+                    cache.pop(entry_id, None)
+                else:
+                    cache[entry_id] = entry
+            if self._cache_versions == versions['before']:
+                self._cache_versions = versions['after']
+
+    def _sync_cache(self):
+        """Reload the caches if another connection changed the FAQ/Intent tables"""
+        conn = self.get_connection()
+        # data_version only changes when *another* connection commits, so the
+        # common case is a single pragma with no table access
+        data_version = conn.execute('PRAGMA data_version').fetchone()[0]
+        if data_version == getattr(self._local, 'data_version', None):
+            return
+        self._local.data_version = data_version
+
+        if self._get_table_versions() != self._cache_versions:
+            self.reload()
+
+    def get_cached_faqs(self) -> List[FAQEntry]:
+        """All FAQ entries from the in-memory cache, newest first"""
+        self._sync_cache()
+        return sorted(self._faq_cache.values(), key=lambda faq: faq.created_at, reverse=True)
 
     def create_faq(
         self,
@@ -142,35 +611,25 @@ class Database:
         audio_status: str = "pending"
     ) -> FAQEntry:
         """Create a new FAQ entry"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        answer_id = str(uuid.uuid4())
-        created_at = datetime.now()
+        answer_id = _new_id()
+        created_at = _now()
         updated_at = created_at
 
-        cursor.execute('''
-            INSERT INTO faq (
-                answer_id, question, answer, alternative_questions,
-                language, category, audio_path, audio_status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            answer_id,
-            question,
-            answer,
-            json.dumps(alternative_questions, ensure_ascii=False),
-            language,
-            category,
-            audio_path,
-            audio_status,
-            created_at,
-            updated_at
-        ))
-
-        conn.commit()
-        conn.close()
-
-        return FAQEntry(
+        with self._versioned_write() as (cursor, versions):
+            cursor.execute(_SQL_INSERT_FAQ, (
+                answer_id,
+                question,
+                answer,
+                _json_dumps(alternative_questions),
+                language,
+                category,
+                audio_path,
+                audio_status,
+                created_at,
+                updated_at
+            ))
+
+        faq = FAQEntry(
             answer_id=answer_id,
             question=question,
             answer=answer,
@@ -182,128 +641,188 @@ class Database:
             created_at=created_at,
             updated_at=updated_at
         )
+        self._apply_cache_write('faq', versions, {answer_id: faq})
+
+        return faq
+
+    def bulk_create_faqs(self, entries: List[Dict]) -> List[FAQEntry]:
+        """
+        Create many FAQ entries with one executemany in a single transaction
+
+        Each entry takes the create_faq arguments as keys (question, answer,
+        alternative_questions, language, category, audio_path, audio_status).
+        Either all entries are inserted or none are.
+        """
+        created_at = _now()
+        faqs = [
+            FAQEntry(
+                answer_id=_new_id(),
+                question=entry['question'],
+                answer=entry['answer'],
+                alternative_questions=entry.get('alternative_questions') or [],
+                language=entry.get('language', 'auto'),
+                category=entry.get('category', 'general'),
+                audio_path=entry.get('audio_path', ''),
+                audio_status=entry.get('audio_status', 'pending'),
+                created_at=created_at,
+                updated_at=created_at
+            )
+            for entry in entries
+        ]
+        if not faqs:
+            return []
+
+        rows = [
+            (
+                faq.answer_id,
+                faq.question,
+                faq.answer,
+                _json_dumps(faq.alternative_questions),
+                faq.language,
+                faq.category,
+                faq.audio_path,
+                faq.audio_status,
+                faq.created_at,
+                faq.updated_at
+            )
+            for faq in faqs
+        ]
+
+        with self._versioned_write() as (cursor, versions):
+            cursor.executemany(_SQL_INSERT_FAQ, rows)
+
+        self._apply_cache_write('faq', versions, {faq.answer_id: faq for faq in faqs})
+
+        return faqs
 
     def get_faq_by_id(self, answer_id: str) -> Optional[FAQEntry]:
         """Get FAQ by answer_id"""
-        conn = self.get_connection()
+        self._sync_cache()
+
+        faq = self._faq_cache.get(answer_id)
+        if faq is not None:
+            return faq
+
+        faq = self._fetch_faq(answer_id)
+        if faq:
+            self._faq_cache[answer_id] = faq
+        return faq
+
+    def _fetch_faq(self, answer_id: str) -> Optional[FAQEntry]:
+        """Read a single FAQ from the database, bypassing the cache"""
+        conn = self.get_read_connection()
         cursor = conn.cursor()
 
-        cursor.execute('SELECT * FROM faq WHERE answer_id = ?', (answer_id,))
+        cursor.execute(_SQL_GET_FAQ_BY_ID, (answer_id,))
         row = cursor.fetchone()
-        conn.close()
 
         if row:
             return self._row_to_faq_entry(row)
         return None
 
-    def get_all_faqs(self) -> List[FAQEntry]:
-        """Get all FAQ entries"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT * FROM faq ORDER BY created_at DESC')
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [self._row_to_faq_entry(row) for row in rows]
-
-    def update_faq(self, answer_id: str, updates: Dict) -> Optional[FAQEntry]:
-        """Update FAQ entry"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+    def get_faqs_by_ids(self, answer_ids: List[str]) -> Dict[str, FAQEntry]:
+        """Get several FAQs in a single query, keyed by answer_id"""
+        if not answer_ids:
+            return {}
 
-        # Build update query dynamically
-        update_fields = []
-        values = []
+        self._sync_cache()
 
-        if 'question' in updates:
-            update_fields.append('question = ?')
-            values.append(updates['question'])
+        found = {}
+        missing = []
+        for answer_id in answer_ids:
+            faq = self._faq_cache.get(answer_id)
+            if faq is not None:
+                found[answer_id] = faq
+            else:
+                missing.append(answer_id)
 
-        if 'answer' in updates:
-            update_fields.append('answer = ?')
-            values.append(updates['answer'])
+        if missing:
+            for answer_id, faq in self._fetch_faqs(missing).items():
+                self._faq_cache[answer_id] = faq
+                found[answer_id] = faq
 
-        if 'alternative_questions' in updates:
-            update_fields.append('alternative_questions = ?')
-            values.append(json.dumps(updates['alternative_questions'], ensure_ascii=False))
+        return found
 
-        if 'language' in updates:
-            update_fields.append('language = ?')
-            values.append(updates['language'])
+    def _fetch_faqs(self, answer_ids: List[str]) -> Dict[str, FAQEntry]:
+        """Read several FAQs from the database in one query, bypassing the cache"""
+        conn = self.get_read_connection()
+        cursor = conn.cursor()
 
-        if 'category' in updates:
-            update_fields.append('category = ?')
-            values.append(updates['category'])
+        placeholders = ','.join('?' * len(answer_ids))
+        cursor.execute(_SQL_GET_FAQS_BY_IDS.format(placeholders=placeholders), list(answer_ids))
+        rows = cursor.fetchall()
 
-        if 'audio_path' in updates:
-            update_fields.append('audio_path = ?')
-            values.append(updates['audio_path'])
+        return {row['answer_id']: self._row_to_faq_entry(row) for row in rows}
 
-        if 'audio_status' in updates:
-            update_fields.append('audio_status = ?')
-            values.append(updates['audio_status'])
+    def get_all_faqs(self) -> List[FAQEntry]:
+        """Get all FAQ entries"""
+        return list(self.iter_faqs())
 
-        update_fields.append('updated_at = ?')
-        values.append(datetime.now())
+    def iter_faqs(self) -> Iterator[FAQEntry]:
+        """Lazily yield all FAQ entries without materializing the whole table"""
+        cursor = self.get_read_connection().cursor()
+        cursor.arraysize = _FETCH_ARRAYSIZE
+        cursor.execute(_SQL_LIST_FAQS)
 
-        values.append(answer_id)
+        for row in cursor:
+            yield self._row_to_faq_entry(row)
 
-        query = f"UPDATE faq SET {', '.join(update_fields)} WHERE answer_id = ?"
-        cursor.execute(query, values)
+    def update_faq(self, answer_id: str, updates: Dict) -> Optional[FAQEntry]:
+        """Update FAQ entry"""
+        # One static statement (cached by sqlite) - absent fields bind NULL and keep their value
+        with self._versioned_write() as (cursor, versions):
+            cursor.execute(
+                _SQL_UPDATE_FAQ_RETURNING if _HAS_RETURNING else _SQL_UPDATE_FAQ,
+                _update_params(_FAQ_UPDATE_FIELDS, updates) + (_now(), answer_id)
+            )
 
-        conn.commit()
-        conn.close()
+            if not _HAS_RETURNING:
+                # Read back on the writing connection, inside the transaction
+                cursor.execute(_SQL_GET_FAQ_BY_ID, (answer_id,))
+            # fetchall() steps the statement to completion before the commit
+            rows = cursor.fetchall()
+            faq = self._row_to_faq_entry(rows[0]) if rows else None
 
-        return self.get_faq_by_id(answer_id)
+        self._apply_cache_write('faq', versions, {answer_id: faq})
+        return faq
 
     def delete_faq(self, answer_id: str) -> bool:
         """Delete FAQ entry"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self._versioned_write() as (cursor, versions):
+            cursor.execute(_SQL_DELETE_FAQ, (answer_id,))
+            deleted = cursor.rowcount > 0
 
-        cursor.execute('DELETE FROM faq WHERE answer_id = ?', (answer_id,))
-        deleted = cursor.rowcount > 0
-
-        conn.commit()
-        conn.close()
+        self._apply_cache_write('faq', versions, {answer_id: None})
 
         return deleted
 
     def search_faqs_by_keyword(self, keyword: str) -> List[FAQEntry]:
         """Simple keyword search in questions and answers"""
-        conn = self.get_connection()
+        conn = self.get_read_connection()
         cursor = conn.cursor()
 
-        cursor.execute('''
-            SELECT * FROM faq
-            WHERE question LIKE ? OR answer LIKE ? OR alternative_questions LIKE ?
-        ''', (f'%{keyword}%', f'%{keyword}%', f'%{keyword}%'))
+        pattern = f'%{keyword}%'
+
+        # Trigram FTS needs at least 3 characters; shorter keywords use a LIKE scan
+        if self.fts_enabled and len(keyword) >= 3:
+            # Quote as an FTS5 phrase so operators in the keyword are matched literally
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            cursor.execute(_SQL_SEARCH_FAQS_FTS, (phrase, pattern, pattern, pattern))
+        else:
+            cursor.execute(_SQL_SEARCH_FAQS_LIKE, (pattern, pattern, pattern))
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [self._row_to_faq_entry(row) for row in rows]
 
     def _row_to_faq_entry(self, row) -> FAQEntry:
-        """Convert database row to FAQEntry object"""
-        # Handle audio_status which may not exist in old databases
-        try:
-            audio_status = row['audio_status']
-        except (KeyError, IndexError):
-            audio_status = 'pending'
-
+        """Convert a row selected with _FAQ_COLUMNS to a FAQEntry object"""
+        (answer_id, question, answer, alternative_questions, language,
+         category, audio_path, created_at, updated_at, audio_status) = row
         return FAQEntry(
-            answer_id=row['answer_id'],
-            question=row['question'],
-            answer=row['answer'],
-            alternative_questions=json.loads(row['alternative_questions']) if row['alternative_questions'] else [],
-            language=row['language'],
-            category=row['category'],
-            audio_path=row['audio_path'],
-            audio_status=audio_status,
-            created_at=row['created_at'],
-            updated_at=row['updated_at']
+            answer_id, question, answer,
+            _json_loads(alternative_questions) if alternative_questions else [],
+            language, category, audio_path, created_at, updated_at, audio_status
         )
 
     # ========================================
@@ -321,35 +840,25 @@ class Database:
         category: str
     ) -> IntentEntry:
         """Create a new intent entry"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        intent_id = str(uuid.uuid4())
-        created_at = datetime.now()
+        intent_id = _new_id()
+        created_at = _now()
         updated_at = created_at
 
-        cursor.execute('''
-            INSERT INTO intent (
-                intent_id, intent_name, description, trigger_phrases,
-                action_type, action_config, language, category, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            intent_id,
-            intent_name,
-            description,
-            json.dumps(trigger_phrases, ensure_ascii=False),
-            action_type,
-            json.dumps(action_config, ensure_ascii=False),
-            language,
-            category,
-            created_at,
-            updated_at
-        ))
-
-        conn.commit()
-        conn.close()
-
-        return IntentEntry(
+        with self._versioned_write() as (cursor, versions):
+            cursor.execute(_SQL_INSERT_INTENT, (
+                intent_id,
+                intent_name,
+                description,
+                _json_dumps(trigger_phrases),
+                action_type,
+                _json_dumps(action_config),
+                language,
+                category,
+                created_at,
+                updated_at
+            ))
+
+        intent = IntentEntry(
             intent_id=intent_id,
             intent_name=intent_name,
             description=description,
@@ -361,104 +870,118 @@ class Database:
             created_at=created_at,
             updated_at=updated_at
         )
+        self._apply_cache_write('intent', versions, {intent_id: intent})
+
+        return intent
 
     def get_intent_by_id(self, intent_id: str) -> Optional[IntentEntry]:
         """Get intent by intent_id"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        self._sync_cache()
 
-        cursor.execute('SELECT * FROM intent WHERE intent_id = ?', (intent_id,))
-        row = cursor.fetchone()
-        conn.close()
+        intent = self._intent_cache.get(intent_id)
+        if intent is not None:
+            return intent
 
-        if row:
-            return self._row_to_intent_entry(row)
-        return None
+        intent = self._fetch_intent(intent_id)
+        if intent:
+            self._intent_cache[intent_id] = intent
+        return intent
 
-    def get_intent_by_name(self, intent_name: str) -> Optional[IntentEntry]:
-        """Get intent by intent_name"""
-        conn = self.get_connection()
+    def _fetch_intent(self, intent_id: str) -> Optional[IntentEntry]:
+        """Read a single intent from the database, bypassing the cache"""
+        conn = self.get_read_connection()
         cursor = conn.cursor()
 
-        cursor.execute('SELECT * FROM intent WHERE intent_name = ?', (intent_name,))
+        cursor.execute(_SQL_GET_INTENT_BY_ID, (intent_id,))
         row = cursor.fetchone()
-        conn.close()
 
         if row:
             return self._row_to_intent_entry(row)
         return None
 
-    def get_all_intents(self) -> List[IntentEntry]:
-        """Get all intent entries"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+    def get_intents_by_ids(self, intent_ids: List[str]) -> Dict[str, IntentEntry]:
+        """Get several intents in a single query, keyed by intent_id"""
+        if not intent_ids:
+            return {}
 
-        cursor.execute('SELECT * FROM intent ORDER BY created_at DESC')
-        rows = cursor.fetchall()
-        conn.close()
+        self._sync_cache()
 
-        return [self._row_to_intent_entry(row) for row in rows]
+        found = {}
+        missing = []
+        for intent_id in intent_ids:
+            intent = self._intent_cache.get(intent_id)
+            if intent is not None:
+                found[intent_id] = intent
+            else:
+                missing.append(intent_id)
 
-    def update_intent(self, intent_id: str, updates: Dict) -> Optional[IntentEntry]:
-        """Update intent entry"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        if missing:
+            for intent_id, intent in self._fetch_intents(missing).items():
+                self._intent_cache[intent_id] = intent
+                found[intent_id] = intent
 
-        # Build update query dynamically
-        update_fields = []
-        values = []
+        return found
 
-        if 'intent_name' in updates:
-            update_fields.append('intent_name = ?')
-            values.append(updates['intent_name'])
+    def _fetch_intents(self, intent_ids: List[str]) -> Dict[str, IntentEntry]:
+        """Read several intents from the database in one query, bypassing the cache"""
+        conn = self.get_read_connection()
+        cursor = conn.cursor()
 
-        if 'description' in updates:
-            update_fields.append('description = ?')
-            values.append(updates['description'])
+        placeholders = ','.join('?' * len(intent_ids))
+        cursor.execute(_SQL_GET_INTENTS_BY_IDS.format(placeholders=placeholders), list(intent_ids))
+        rows = cursor.fetchall()
 
-        if 'trigger_phrases' in updates:
-            update_fields.append('trigger_phrases = ?')
-            values.append(json.dumps(updates['trigger_phrases'], ensure_ascii=False))
+        return {row['intent_id']: self._row_to_intent_entry(row) for row in rows}
 
-        if 'action_type' in updates:
-            update_fields.append('action_type = ?')
-            values.append(updates['action_type'])
+    def get_intent_by_name(self, intent_name: str) -> Optional[IntentEntry]:
+        """Get intent by intent_name"""
+        conn = self.get_read_connection()
+        cursor = conn.cursor()
 
-        if 'action_config' in updates:
-            update_fields.append('action_config = ?')
-            values.append(json.dumps(updates['action_config'], ensure_ascii=False))
+        cursor.execute(_SQL_GET_INTENT_BY_NAME, (intent_name,))
+        row = cursor.fetchone()
 
-        if 'language' in updates:
-            update_fields.append('language = ?')
-            values.append(updates['language'])
+        if row:
+            return self._row_to_intent_entry(row)
+        return None
 
-        if 'category' in updates:
-            update_fields.append('category = ?')
-            values.append(updates['category'])
+    def get_all_intents(self) -> List[IntentEntry]:
+        """Get all intent entries"""
+        return list(self.iter_intents())
 
-        update_fields.append('updated_at = ?')
-        values.append(datetime.now())
+    def iter_intents(self) -> Iterator[IntentEntry]:
+        """Lazily yield all intent entries without materializing the whole table"""
+        cursor = self.get_read_connection().cursor()
+        cursor.arraysize = _FETCH_ARRAYSIZE
+        cursor.execute(_SQL_LIST_INTENTS)
 
-        values.append(intent_id)
+        for row in cursor:
+            yield self._row_to_intent_entry(row)
 
-        query = f"UPDATE intent SET {', '.join(update_fields)} WHERE intent_id = ?"
-        cursor.execute(query, values)
+    def update_intent(self, intent_id: str, updates: Dict) -> Optional[IntentEntry]:
+        """Update intent entry"""
+        # One static statement (cached by sqlite) - absent fields bind NULL and keep their value
+        with self._versioned_write() as (cursor, versions):
+            cursor.execute(
+                _SQL_UPDATE_INTENT_RETURNING if _HAS_RETURNING else _SQL_UPDATE_INTENT,
+                _update_params(_INTENT_UPDATE_FIELDS, updates) + (_now(), intent_id)
+            )
 
-        conn.commit()
-        conn.close()
+            if not _HAS_RETURNING:
+                cursor.execute(_SQL_GET_INTENT_BY_ID, (intent_id,))
+            rows = cursor.fetchall()
+            intent = self._row_to_intent_entry(rows[0]) if rows else None
 
-        return self.get_intent_by_id(intent_id)
+        self._apply_cache_write('intent', versions, {intent_id: intent})
+        return intent
 
     def delete_intent(self, intent_id: str) -> bool:
         """Delete intent entry"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self._versioned_write() as (cursor, versions):
+            cursor.execute(_SQL_DELETE_INTENT, (intent_id,))
+            deleted = cursor.rowcount > 0
 
-        cursor.execute('DELETE FROM intent WHERE intent_id = ?', (intent_id,))
-        deleted = cursor.rowcount > 0
-
-        conn.commit()
-        conn.close()
+        self._apply_cache_write('intent', versions, {intent_id: None})
 
         return deleted
 
@@ -468,9 +991,9 @@ class Database:
             intent_id=row['intent_id'],
             intent_name=row['intent_name'],
             description=row['description'],
-            trigger_phrases=json.loads(row['trigger_phrases']) if row['trigger_phrases'] else [],
+            trigger_phrases=_json_loads(row['trigger_phrases']) if row['trigger_phrases'] else [],
             action_type=row['action_type'],
-            action_config=json.loads(row['action_config']) if row['action_config'] else {},
+            action_config=_json_loads(row['action_config']) if row['action_config'] else {},
             language=row['language'],
             category=row['category'],
             created_at=row['created_at'],
@@ -490,125 +1013,182 @@ class Database:
         confidence: Optional[float] = None,
         response_time: Optional[float] = None
     ) -> str:
-        """Create a new query log entry"""
-        from .models import QueryLog
+        """Queue a new query log entry; it is written by the background flusher"""
+        log_id = _new_id()
 
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        log_id = str(uuid.uuid4())
-        created_at = datetime.now()
-
-        cursor.execute('''
-            INSERT INTO query_logs (
-                log_id, query_text, matched_type, matched_id,
-                matched_question, confidence, response_time, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        # created_at is stamped once per batch when the row is written
+        self._log_queue.put((
             log_id,
             query_text,
             matched_type,
             matched_id,
             matched_question,
             confidence,
-            response_time,
-            created_at
+            response_time
         ))
 
-        conn.commit()
-        conn.close()
-
         return log_id
 
-    def get_query_logs(self, limit: int = 100, offset: int = 0, matched_type: Optional[str] = None) -> List[Dict]:
-        """Get query logs with optional filtering"""
+    def _write_query_logs(self, rows: List[tuple]):
+        """Insert a batch of query log rows in a single transaction"""
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        query = 'SELECT * FROM query_logs'
-        params = []
+        # One timestamp for the whole batch (rows are at most log_flush_interval apart)
+        created_at = _now()
+
+        with self._write_lock:
+            try:
+                cursor.execute('BEGIN')
+                cursor.executemany(_SQL_INSERT_QUERY_LOG, [row + (created_at,) for row in rows])
+                cursor.execute('COMMIT')
+            except Exception:
+                if conn.in_transaction:
+                    cursor.execute('ROLLBACK')
+                raise
+
+    def _flush_query_logs_forever(self):
+        """Background thread: batch queued query logs into executemany inserts"""
+        while True:
+            batch = [self._log_queue.get()]
+            deadline = time.monotonic() + self.log_flush_interval
+
+            # Fill the batch until it is full, the interval passes or flush() asks for it
+            while not isinstance(batch[-1], threading.Event) and len(batch) < self.log_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._log_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            rows = [item for item in batch if not isinstance(item, threading.Event)]
+            try:
+                if rows:
+                    self._write_query_logs(rows)
+            except Exception as e:
+                # Never let one bad batch stop the writer, or every later flush() would stall
+                print(f"Failed to write {len(rows)} query logs: {e}")
+            finally:
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()
+                    self._log_queue.task_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write all queued query logs now (used on shutdown and before reading logs)
+
+        Waits at most `timeout` seconds (default: database.log_flush_timeout)
+        and returns False if the writer did not get to the queued logs in time.
+        """
+        # The queued event marks the end of a batch: the writer stops filling it
+        # there, so rows are still written (and timestamped) in the order they
+        # were queued, and sets the event once that batch has been handled
+        marker = threading.Event()
+        self._log_queue.put(marker)
+        return marker.wait(self.log_flush_timeout if timeout is None else timeout)
+
+    def get_query_logs(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        matched_type: Optional[str] = None,
+        before: Optional[Tuple[str, int]] = None
+    ) -> List[Dict]:
+        """
+        Get query logs (newest first) with optional filtering
 
-        # Add filter if specified
-        if matched_type and matched_type != 'all':
-            query += ' WHERE matched_type = ?'
-            params.append(matched_type)
+        Pass the (created_at, rowid) of the last log of a page as `before` to
+        get the next page; this seeks directly instead of skipping `offset` rows.
+        """
+        return list(self.iter_query_logs(limit, offset, matched_type, before))
 
-        query += ' ORDER BY created_at DESC LIMIT ? OFFSET ?'
-        params.extend([limit, offset])
+    def iter_query_logs(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        matched_type: Optional[str] = None,
+        before: Optional[Tuple[str, int]] = None
+    ) -> Iterator[Dict]:
+        """Lazily yield query logs (newest first), see get_query_logs"""
+        self.flush()
+        cursor = self.get_read_connection().cursor()
+        cursor.arraysize = _FETCH_ARRAYSIZE
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        # Convert rows to dictionaries
-        logs = []
-        for row in rows:
-            logs.append({
-                'log_id': row['log_id'],
-                'query_text': row['query_text'],
-                'matched_type': row['matched_type'],
-                'matched_id': row['matched_id'],
-                'matched_question': row['matched_question'],
-                'confidence': row['confidence'],
-                'response_time': row['response_time'],
-                'created_at': row['created_at']
-            })
-
-        return logs
+        # Add filter if specified
+        filtered = matched_type and matched_type != 'all'
+        if before is not None:
+            created_at, rowid = before
+            if filtered:
+                cursor.execute(_SQL_LIST_QUERY_LOGS_BY_TYPE_BEFORE, (matched_type, created_at, rowid, limit))
+            else:
+                cursor.execute(_SQL_LIST_QUERY_LOGS_BEFORE, (created_at, rowid, limit))
+        elif filtered:
+            cursor.execute(_SQL_LIST_QUERY_LOGS_BY_TYPE, (matched_type, limit, offset))
+        else:
+            cursor.execute(_SQL_LIST_QUERY_LOGS, (limit, offset))
+
+        # Convert rows to dictionaries in one pass, without per-column name lookups
+        for row in cursor:
+            yield dict(zip(_QUERY_LOG_COLUMNS, row))
 
     def get_query_stats(self, days: int = 7) -> Dict:
-        """Get query statistics for dashboard"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        """Get query statistics for dashboard (cached for stats_cache_ttl seconds per `days`)"""
+        now = time.monotonic()
+        with self._stats_lock:
+            cached = self._stats_cache.get(days)
+            if cached is not None and cached[0] > now:
+                return cached[1]
 
-        # Today's queries count
-        cursor.execute('''
-            SELECT COUNT(*) as count
-            FROM query_logs
-            WHERE DATE(created_at) = DATE('now')
-        ''')
-        today_queries = cursor.fetchone()['count']
+        stats = self._compute_query_stats(days)
 
-        # Total queries count
-        cursor.execute('SELECT COUNT(*) as count FROM query_logs')
-        total_queries = cursor.fetchone()['count']
+        with self._stats_lock:
+            self._stats_cache[days] = (now + self.stats_cache_ttl, stats)
 
-        # Average response time
-        cursor.execute('SELECT AVG(response_time) as avg_time FROM query_logs WHERE response_time IS NOT NULL')
-        avg_response_time = cursor.fetchone()['avg_time'] or 0.0
+        return stats
 
-        # Top 5 FAQs
-        cursor.execute('''
-            SELECT matched_question, COUNT(*) as count
-            FROM query_logs
-            WHERE matched_type = 'faq' AND matched_question IS NOT NULL
-            GROUP BY matched_question
-            ORDER BY count DESC
-            LIMIT 5
-        ''')
-        top_faqs = [{'question': row['matched_question'], 'count': row['count']} for row in cursor.fetchall()]
+    def _compute_query_stats(self, days: int) -> Dict:
+        """Run the dashboard aggregation query"""
+        self.flush()
+        conn = self.get_read_connection()
+        cursor = conn.cursor()
 
-        # Intent distribution
-        cursor.execute('''
-            SELECT matched_question, COUNT(*) as count
-            FROM query_logs
-            WHERE matched_type = 'intent' AND matched_question IS NOT NULL
-            GROUP BY matched_question
-            ORDER BY count DESC
-        ''')
-        intent_distribution = [{'intent_name': row['matched_question'], 'count': row['count']} for row in cursor.fetchall()]
-
-        # Daily trend (last N days)
-        cursor.execute(f'''
-            SELECT DATE(created_at) as date, COUNT(*) as count
-            FROM query_logs
-            WHERE created_at >= DATE('now', '-{days} days')
-            GROUP BY DATE(created_at)
-            ORDER BY date ASC
-        ''')
-        daily_trend = [{'date': row['date'], 'count': row['count']} for row in cursor.fetchall()]
+        # Bounds as strings in the same format created_at is stored in, so the
+        # filters are plain range scans on idx_query_created_at
+        today = datetime.combine(date.today(), datetime.min.time())
+        tomorrow = today + timedelta(days=1)
+        trend_start = today - timedelta(days=days)
+
+        cursor.execute(_SQL_QUERY_STATS, (
+            today.isoformat(' '),
+            tomorrow.isoformat(' '),
+            trend_start.isoformat(' ')
+        ))
 
-        conn.close()
+        today_queries = total_queries = 0
+        avg_response_time = 0.0
+        top_faqs = []
+        intent_distribution = []
+        daily_trend = []
+        for row in cursor.fetchall():
+            kind = row['kind']
+            if kind == 'totals':
+                total_queries = row['count']
+                today_queries = row['today']
+                avg_response_time = row['avg_time'] or 0.0
+            elif kind == 'faq':
+                top_faqs.append({'question': row['label'], 'count': row['count']})
+            elif kind == 'intent':
+                intent_distribution.append({'intent_name': row['label'], 'count': row['count']})
+            else:
+                daily_trend.append({'date': row['label'], 'count': row['count']})
+
+        # UNION ALL doesn't keep per-branch order: FAQs and intents by count, trend by date
+        top_faqs.sort(key=lambda item: item['count'], reverse=True)
+        intent_distribution.sort(key=lambda item: item['count'], reverse=True)
+        daily_trend.sort(key=lambda item: item['date'])
 
         return {
             'today_queries': today_queries,
@@ -620,5 +1200,5 @@ class Database:
         }
 
 
-# Global database instance
-db = Database()
+# Global database instance (opened on first use)
+db = LazyProxy(Database)
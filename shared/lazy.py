@@ -0,0 +1,39 @@
+"""
+Lazy Instance Proxy for SpeakSense
+Defers construction of expensive module-level singletons until first use
+"""
+import threading
+from typing import Any, Callable
+
+
+class LazyProxy:
+    """Proxy that builds the wrapped object on first attribute access"""
+
+    __slots__ = ('_factory', '_instance', '_lock')
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _get_instance(self) -> Any:
+        instance = object.__getattribute__(self, '_instance')
+        if instance is None:
+            with object.__getattribute__(self, '_lock'):
+                instance = object.__getattribute__(self, '_instance')
+                if instance is None:
+                    instance = object.__getattribute__(self, '_factory')()
+                    object.__setattr__(self, '_instance', instance)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_instance(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._get_instance(), name, value)
+
+    def __repr__(self) -> str:
+        instance = object.__getattribute__(self, '_instance')
+        if instance is None:
+            return "<LazyProxy (not initialized)>"
+        return repr(instance)
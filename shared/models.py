@@ -2,9 +2,49 @@
 Pydantic Models for SpeakSense
 Data validation and serialization models
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict
 from datetime import datetime
+from functools import lru_cache
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# FAQEntry/IntentEntry timestamps are always the stored strings, so from_db()
+# parses them unconditionally instead of type-checking each value
+_parse_timestamp = datetime.fromisoformat
+
+
+@lru_cache(maxsize=128)
+def _is_complete_shape(cls, keys: frozenset) -> bool:
+    """Whether `keys` are exactly the fields of a plain (no extras/post-init) model"""
+    return (
+        keys == frozenset(cls.model_fields)
+        and not cls.__pydantic_post_init__
+        and cls.model_config.get('extra') != 'allow'
+    )
+
+
+def _fast_construct(cls, data: Dict):
+    """
+    model_construct() for trusted data, skipping its per-field default pass
+    when `data` already holds every field. Takes ownership of `data`.
+    """
+    keys = frozenset(data)
+    if not _is_complete_shape(cls, keys):
+        return cls.model_construct(**data)
+
+    m = cls.__new__(cls)
+    object.__setattr__(m, '__dict__', data)
+    object.__setattr__(m, '__pydantic_fields_set__', set(keys))
+    object.__setattr__(m, '__pydantic_extra__', None)
+    object.__setattr__(m, '__pydantic_private__', None)
+    return m
 
 
 # ============ ASR Service Models ============
@@ -17,6 +57,8 @@ class ASRRequest(BaseModel):
 
 class ASRResponse(BaseModel):
     """Response model for ASR transcription"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     text: str
     language: Optional[str] = None
     confidence: Optional[float] = None
@@ -40,11 +82,36 @@ class RetrievalResponse(BaseModel):
     confidence: float
     matched_by: str  # "bm25", "vector", "hybrid"
 
+    @classmethod
+    def from_db(cls, data: Dict) -> "RetrievalResponse":
+        """Build from trusted search results, skipping validation"""
+        return _fast_construct(cls, data)
+
 
 # ============ Admin Service Models ============
 
+class PartialUpdate(BaseModel):
+    """Base for update models whose fields are all optional"""
+
+    def to_updates(self) -> Dict:
+        """
+        Fields the client actually sent, without nulls
+
+        Only walks the explicitly set fields instead of dumping every field
+        and filtering (equivalent to model_dump(exclude_none=True) here)
+        """
+        values = self.__dict__
+        return {
+            name: values[name]
+            for name in self.__pydantic_fields_set__
+            if values[name] is not None
+        }
+
+
 class FAQCreate(BaseModel):
     """Model for creating a new FAQ entry"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     question: str = Field(..., description="Standard question text")
     answer: str = Field(..., description="Standard answer text")
     alternative_questions: Optional[List[str]] = Field(default=[], description="Alternative phrasings")
@@ -55,6 +122,8 @@ class FAQCreate(BaseModel):
 
 class FAQResponse(BaseModel):
     """Response model for FAQ operations"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     answer_id: str
     question: str
     answer: str
@@ -66,8 +135,15 @@ class FAQResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_db(cls, data: Dict) -> "FAQResponse":
+        """Build from trusted database values, skipping validation"""
+        data['created_at'] = _parse_timestamp(data['created_at'])
+        data['updated_at'] = _parse_timestamp(data['updated_at'])
+        return _fast_construct(cls, data)
+
 
-class FAQUpdate(BaseModel):
+class FAQUpdate(PartialUpdate):
     """Model for updating an FAQ entry"""
     question: Optional[str] = None
     answer: Optional[str] = None
@@ -85,6 +161,12 @@ class FAQDelete(BaseModel):
 
 class FAQEntry:
     """Database model for FAQ entry"""
+    __slots__ = (
+        'answer_id', 'question', 'answer', 'alternative_questions', 'language',
+        'category', 'audio_path', 'audio_status', 'created_at', 'updated_at',
+        '_cached_json'
+    )
+
     def __init__(
         self,
         answer_id: str,
@@ -94,8 +176,8 @@ class FAQEntry:
         language: str,
         category: str,
         audio_path: str,
-        created_at: datetime,
-        updated_at: datetime,
+        created_at: str,
+        updated_at: str,
         audio_status: str = "pending"
     ):
         self.answer_id = answer_id
@@ -108,8 +190,10 @@ class FAQEntry:
         self.audio_status = audio_status  # pending, generating, completed, failed
         self.created_at = created_at
         self.updated_at = updated_at
+        self._cached_json = None
 
     def to_dict(self) -> Dict:
+        # Timestamps are stored strings, so this is a plain attribute copy
         return {
             "answer_id": self.answer_id,
             "question": self.question,
@@ -119,10 +203,27 @@ class FAQEntry:
             "category": self.category,
             "audio_path": self.audio_path,
             "audio_status": self.audio_status,
-            "created_at": self.created_at.isoformat() if isinstance(self.created_at, datetime) else self.created_at,
-            "updated_at": self.updated_at.isoformat() if isinstance(self.updated_at, datetime) else self.updated_at,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
+    def as_json_bytes(self) -> bytes:
+        """
+        FAQResponse-shaped JSON for this entry, serialized once and reused
+
+        Entries are never mutated in place (updates build a new FAQEntry),
+        so the cached bytes cannot go stale.
+        """
+        if self._cached_json is None:
+            data = self.to_dict()
+            data["created_at"] = data["created_at"].replace(" ", "T", 1)
+            data["updated_at"] = data["updated_at"].replace(" ", "T", 1)
+            if ORJSON_AVAILABLE:
+                self._cached_json = orjson.dumps(data)
+            else:
+                self._cached_json = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        return self._cached_json
+
 
 # ============ Intent Service Models ============
 
@@ -150,8 +251,15 @@ class IntentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_db(cls, data: Dict) -> "IntentResponse":
+        """Build from trusted database values, skipping validation"""
+        data['created_at'] = _parse_timestamp(data['created_at'])
+        data['updated_at'] = _parse_timestamp(data['updated_at'])
+        return _fast_construct(cls, data)
 
-class IntentUpdate(BaseModel):
+
+class IntentUpdate(PartialUpdate):
     """Model for updating an intent entry"""
     intent_name: Optional[str] = None
     description: Optional[str] = None
@@ -164,6 +272,11 @@ class IntentUpdate(BaseModel):
 
 class IntentEntry:
     """Database model for intent entry"""
+    __slots__ = (
+        'intent_id', 'intent_name', 'description', 'trigger_phrases', 'action_type',
+        'action_config', 'language', 'category', 'created_at', 'updated_at'
+    )
+
     def __init__(
         self,
         intent_id: str,
@@ -174,8 +287,8 @@ class IntentEntry:
         action_config: Dict,
         language: str,
         category: str,
-        created_at: datetime,
-        updated_at: datetime
+        created_at: str,
+        updated_at: str
     ):
         self.intent_id = intent_id
         self.intent_name = intent_name
@@ -198,8 +311,8 @@ class IntentEntry:
             "action_config": self.action_config,
             "language": self.language,
             "category": self.category,
-            "created_at": self.created_at.isoformat() if isinstance(self.created_at, datetime) else self.created_at,
-            "updated_at": self.updated_at.isoformat() if isinstance(self.updated_at, datetime) else self.updated_at,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
 
@@ -222,6 +335,11 @@ class ErrorResponse(BaseModel):
 
 class QueryLog:
     """Query log entry for analytics"""
+    __slots__ = (
+        'log_id', 'query_text', 'matched_type', 'matched_id', 'matched_question',
+        'confidence', 'response_time', 'created_at'
+    )
+
     def __init__(
         self,
         log_id: str,
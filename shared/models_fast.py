@@ -0,0 +1,67 @@
+"""
+msgspec mirrors of the small request models in shared.models
+Used to decode request bodies on hot endpoints; when msgspec is not
+installed the Pydantic models are used instead
+"""
+from typing import Optional
+
+from shared.models import ASRRequest, RetrievalRequest, FAQDelete
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+_DECODERS = {}
+
+if MSGSPEC_AVAILABLE:
+    class ASRRequestStruct(msgspec.Struct, kw_only=True):
+        """msgspec mirror of ASRRequest"""
+        audio_base64: Optional[str] = None
+        language: Optional[str] = "auto"
+
+    class RetrievalRequestStruct(msgspec.Struct, kw_only=True):
+        """msgspec mirror of RetrievalRequest"""
+        query: str
+        top_k: Optional[int] = 1
+        language: Optional[str] = "auto"
+
+    class FAQDeleteStruct(msgspec.Struct, kw_only=True):
+        """msgspec mirror of FAQDelete"""
+        answer_id: str
+
+    _DECODERS = {
+        ASRRequest: msgspec.json.Decoder(ASRRequestStruct),
+        RetrievalRequest: msgspec.json.Decoder(RetrievalRequestStruct),
+        FAQDelete: msgspec.json.Decoder(FAQDeleteStruct),
+    }
+
+
+def decode_request(raw: bytes, model):
+    """
+    Decode and validate a JSON request body
+
+    Args:
+        raw: Raw request body
+        model: Pydantic request model (ASRRequest, RetrievalRequest or FAQDelete)
+
+    Returns:
+        The msgspec mirror of `model` when msgspec is installed and the body
+        passes its strict decode, otherwise a `model` instance; both expose
+        the same attributes
+
+    Raises:
+        pydantic.ValidationError: If the body is not valid for `model`
+    """
+    decoder = _DECODERS.get(model)
+    if decoder is not None:
+        try:
+            return decoder.decode(raw)
+        except msgspec.DecodeError:
+            # Let Pydantic decide: it accepts lax inputs msgspec rejects
+            # (e.g. "top_k": "3") and reports errors in FastAPI's shape
+            pass
+
+    return model.model_validate_json(raw)
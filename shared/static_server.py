@@ -0,0 +1,188 @@
+"""
+Static file server shared by the web testing portal and the admin portal
+Serves the project root with CORS, ETags and sendfile, from several worker
+processes sharing one port
+"""
+import http.server
+from http import HTTPStatus
+from pathlib import Path
+import os
+import signal
+import socket
+import stat
+import sys
+import traceback
+
+WEB_ROOT = str(Path(__file__).resolve().parent.parent)  # Project root, served as the document root
+CORS_HEADERS = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+)
+WORKERS = os.cpu_count() or 1  # Server processes sharing the port via SO_REUSEPORT
+SENDFILE_THRESHOLD = 64 * 1024  # Bodies up to this size go out in a single write
+
+
+class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """HTTP request handler with CORS support"""
+
+    etag = None  # Validator of the file being served, if any
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=WEB_ROOT, **kwargs)
+
+    def send_head(self):
+        # Weak ETag from mtime and size; a matching If-None-Match gets a 304
+        # without opening the file (If-Modified-Since is handled by the base class)
+        self.etag = None
+        path = self.translate_path(self.path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return super().send_head()
+
+        if stat.S_ISREG(st.st_mode) and not path.endswith('/'):
+            self.etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            if_none_match = self.headers.get('If-None-Match')
+            if if_none_match and (
+                if_none_match.strip() == '*'
+                or self.etag in (tag.strip() for tag in if_none_match.split(','))
+            ):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.end_headers()
+                return None
+
+        return super().send_head()
+
+    def end_headers(self):
+        # Add CORS headers; appended to the header buffer (not written to
+        # wfile) so they still follow the status line
+        if self.request_version != 'HTTP/0.9':
+            if not hasattr(self, '_headers_buffer'):
+                self._headers_buffer = []
+            self._headers_buffer.append(CORS_HEADERS)
+        if self.etag is not None:
+            self.send_header('ETag', self.etag)
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        # Stream large bodies (audio) with sendfile(2) rather than read/write
+        # copies; socket.sendfile falls back to send() where it's unsupported.
+        # Small assets are cheaper as one read and one write.
+        try:
+            size = os.fstat(source.fileno()).st_size
+        except OSError:
+            size = 0  # In-memory body (directory listing)
+
+        if size > SENDFILE_THRESHOLD:
+            self.connection.sendfile(source)
+        else:
+            outputfile.write(source.read())
+
+    def do_OPTIONS(self):
+        self.send_response(200)
+        self.end_headers()
+
+
+class ReusePortHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server that several worker processes can bind on one port"""
+    daemon_threads = True
+
+    def server_bind(self):
+        # Set SO_REUSEPORT directly: socketserver's allow_reuse_port only
+        # exists from Python 3.11 and is silently ignored before that
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+def _run_worker(port: int):
+    """Body of a forked worker process; never returns"""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    try:
+        with ReusePortHTTPServer(("", port), CORSHTTPRequestHandler) as httpd:
+            httpd.serve_forever()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    except BaseException:
+        # Bind failures and crashes must reach the parent as a failed exit
+        print(f"Server worker {os.getpid()} failed:", file=sys.stderr)
+        traceback.print_exc()
+        sys.stderr.flush()
+        os._exit(1)
+    os._exit(0)
+
+
+def start_workers(count: int, port: int) -> list:
+    """Fork count extra server processes; the kernel balances accept() across them"""
+    if count <= 0 or not hasattr(os, 'fork') or not hasattr(socket, 'SO_REUSEPORT'):
+        return []
+
+    children = []
+    for _ in range(count):
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(port)
+        children.append(pid)
+    return children
+
+
+def reap_workers(children: list):
+    """Reap exited workers and report the ones that failed"""
+    for pid in list(children):
+        try:
+            reaped, status = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            children.remove(pid)
+            continue
+        if reaped == 0:
+            continue
+
+        children.remove(pid)
+        exit_code = os.waitstatus_to_exitcode(status)
+        if exit_code != 0:
+            print(f"Server worker {pid} exited with status {exit_code} "
+                  f"({len(children) + 1} processes left)", file=sys.stderr)
+
+
+def stop_workers(children: list):
+    """Terminate and reap forked server processes"""
+    for pid in children:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+        except OSError:
+            pass
+
+
+def exit_on_sigterm(signum, frame):
+    """Turn SIGTERM into SystemExit so cleanup (stop_workers) still runs"""
+    raise SystemExit(0)
+
+
+def serve(port: int, banner: str, shutdown_message: str):
+    """
+    Serve WEB_ROOT on port from WORKERS processes until interrupted
+
+    banner is printed once the parent is listening; it may use the {port}
+    and {workers} placeholders.
+    """
+    signal.signal(signal.SIGTERM, exit_on_sigterm)
+
+    workers = []
+    if hasattr(signal, 'SIGCHLD'):
+        signal.signal(signal.SIGCHLD, lambda signum, frame: reap_workers(workers))
+    workers.extend(start_workers(WORKERS - 1, port))
+    reap_workers(workers)  # Workers that failed before their pid was recorded
+
+    try:
+        with ReusePortHTTPServer(("", port), CORSHTTPRequestHandler) as httpd:
+            print(banner.format(port=port, workers=len(workers) + 1))
+            try:
+                httpd.serve_forever()
+            except KeyboardInterrupt:
+                print(f"\n\n{shutdown_message}")
+    finally:
+        if hasattr(signal, 'SIGCHLD'):
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        stop_workers(workers)